@@ -1,57 +1,123 @@
-from typing import Any, Dict, Generator, Optional
+from functools import lru_cache
+from typing import Any, Optional, Tuple
 
-from fastapi import Depends, HTTPException, status
+import firebase_admin
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from firebase_admin import auth as firebase_auth
+from firebase_admin import firestore
 
+from app.core.config import settings
 from app.core.logging import get_logger, log_security_event
-from app.models.user import User, UserInDB
+from app.core.security import (
+    get_cached_id_token,
+    is_well_formed_id_token,
+    verify_id_token_cached,
+)
+from app.models.user import UserInDB
 from app.services.auth import get_auth_service
 from app.services.firebase import get_firebase_app
-from app.services.firestore import get_firestore_service
+from app.services.firestore import FirestoreService, get_firestore_service
+from app.utils.helpers import create_background_task
 
 logger = get_logger(__name__)
 
-# Security scheme for Bearer token
+# Security schemes for Bearer token
 security = HTTPBearer()
+security_optional = HTTPBearer(auto_error=False)
 
+# Process-wide service singletons, resolved once instead of per request
+_auth_service = get_auth_service()
+_firestore_service = get_firestore_service()
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-) -> UserInDB:
-    """Get current authenticated user from Firebase token."""
+# Authenticated users keyed by UID
+_user_cache: TTLCache = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL
+)
+
+# UIDs whose last_login_at was written within the update interval
+_last_login_written: TTLCache = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.LAST_LOGIN_UPDATE_INTERVAL
+)
+
+
+@lru_cache(maxsize=1)
+def _get_firebase_app() -> firebase_admin.App:
+    """Get the Firebase app, resolving it on first use."""
+    return get_firebase_app()
+
+
+def invalidate_cached_user(uid: str) -> None:
+    """Drop a user from the authenticated user cache."""
+    _user_cache.pop(uid, None)
+
+
+async def _update_last_login(uid: str) -> None:
+    """Record the user's last login time."""
     try:
-        # Verify Firebase ID token
-        token = credentials.credentials
-        decoded_token = firebase_auth.verify_id_token(token, app=get_firebase_app())
+        await _firestore_service.update_document(
+            "users", uid, {"last_login_at": firestore.SERVER_TIMESTAMP}
+        )
+    except Exception as e:
+        # Already logged by the Firestore service; allow a retry next request
+        _last_login_written.pop(uid, None)
+        logger.warning("Failed to update last login", uid=uid, error=str(e))
 
-        # Get user from auth service
-        auth_service = get_auth_service()
-        user_data = await auth_service.get_user_by_uid(decoded_token["uid"])
 
-        if not user_data:
-            log_security_event("user_not_found", user_id=decoded_token["uid"])
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-            )
+async def _load_user(uid: str) -> UserInDB:
+    """Load an active user by UID, using the user cache."""
+    user = _user_cache.get(uid)
+    if user is not None:
+        return user
 
-        if user_data.get("disabled", False):
-            log_security_event(
-                "disabled_user_access_attempt", user_id=decoded_token["uid"]
-            )
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN, detail="Account is disabled"
-            )
+    # Get user from auth service
+    user_data = await _auth_service.get_user_by_uid(uid)
 
-        # Update last login time
-        firestore_service = get_firestore_service()
-        await firestore_service.update_document(
-            "users",
-            decoded_token["uid"],
-            {"last_login_at": firestore_service.client.SERVER_TIMESTAMP},
+    if not user_data:
+        log_security_event("user_not_found", user_id=uid)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
-        return UserInDB.from_firestore_doc(user_data)
+    if user_data.get("disabled", False):
+        log_security_event("disabled_user_access_attempt", user_id=uid)
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Account is disabled"
+        )
+
+    user = UserInDB.from_firestore_doc(user_data)
+    _user_cache[uid] = user
+    return user
+
+
+async def _authenticate(token: str) -> UserInDB:
+    """Verify an ID token and load its user.
+
+    Nothing is looked up for a token until its signature has been verified.
+    """
+    decoded_token = get_cached_id_token(token)
+    if decoded_token is None:
+        if not is_well_formed_id_token(token):
+            raise firebase_auth.InvalidIdTokenError("Malformed ID token")
+        decoded_token = await verify_id_token_cached(token, _get_firebase_app())
+
+    return await _load_user(decoded_token["uid"])
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> UserInDB:
+    """Get current authenticated user from Firebase token."""
+    try:
+        user = await _authenticate(credentials.credentials)
+
+        # Update last login time (at most once per interval per user)
+        if user.uid not in _last_login_written:
+            _last_login_written[user.uid] = True
+            create_background_task(_update_last_login(user.uid))
+
+        return user
 
     except firebase_auth.InvalidIdTokenError:
         log_security_event("invalid_token", error="Invalid ID token")
@@ -83,22 +149,14 @@ async def get_current_user(
         )
 
 
-async def get_current_active_user(
-    current_user: UserInDB = Depends(get_current_user),
-) -> UserInDB:
-    """Get current active user (not disabled)."""
-    if current_user.disabled:
-        log_security_event("disabled_user_access_attempt", user_id=current_user.uid)
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail="Account is disabled"
-        )
-    return current_user
+# get_current_user never returns a disabled user, so there is nothing left to check
+get_current_active_user = get_current_user
 
 
-async def get_current_verified_user(
-    current_user: UserInDB = Depends(get_current_active_user),
+async def require_verified(
+    current_user: UserInDB = Depends(get_current_user),
 ) -> UserInDB:
-    """Get current verified user (email verified)."""
+    """Get current active user with a verified email."""
     if not current_user.email_verified:
         log_security_event("unverified_user_access_attempt", user_id=current_user.uid)
         raise HTTPException(
@@ -107,13 +165,22 @@ async def get_current_verified_user(
     return current_user
 
 
-def require_roles(*required_roles: str):
-    """Dependency factory for role-based access control."""
+# Kept for compatibility
+get_current_verified_user = require_verified
 
-    def role_checker(
+
+@lru_cache(maxsize=64)
+def _role_checker_for(required_roles: Tuple[str, ...]):
+    """Build the role checker for a normalized role tuple."""
+    required = frozenset(required_roles)
+    denied_detail = (
+        f"Insufficient permissions. Required roles: {', '.join(required_roles)}"
+    )
+
+    async def role_checker(
         current_user: UserInDB = Depends(get_current_active_user),
     ) -> UserInDB:
-        if not any(role in current_user.roles for role in required_roles):
+        if required.isdisjoint(current_user.roles_set):
             log_security_event(
                 "insufficient_permissions",
                 user_id=current_user.uid,
@@ -121,28 +188,36 @@ def require_roles(*required_roles: str):
                 user_roles=current_user.roles,
             )
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Insufficient permissions. Required roles: {', '.join(required_roles)}",
+                status_code=status.HTTP_403_FORBIDDEN, detail=denied_detail
             )
         return current_user
 
     return role_checker
 
 
+def require_roles(*required_roles: str):
+    """Dependency factory for role-based access control.
+
+    Returns the same checker for the same set of roles so FastAPI can
+    deduplicate it within a request.
+    """
+    return _role_checker_for(tuple(sorted(set(required_roles))))
+
+
 def require_admin():
     """Dependency for admin access."""
-    return require_roles("admin")
+    return _role_checker_for(("admin",))
 
 
 def require_moderator():
     """Dependency for moderator access."""
-    return require_roles("admin", "moderator")
+    return _role_checker_for(("admin", "moderator"))
 
 
 def require_custom_claim(claim_name: str, claim_value: Any = True):
     """Dependency factory for custom claim-based access control."""
 
-    def claim_checker(
+    async def claim_checker(
         current_user: UserInDB = Depends(get_current_active_user),
     ) -> UserInDB:
         user_claims = current_user.custom_claims or {}
@@ -178,28 +253,14 @@ def require_custom_claim(claim_name: str, claim_value: Any = True):
 
 
 async def get_optional_current_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(
-        HTTPBearer(auto_error=False)
-    ),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security_optional),
 ) -> Optional[UserInDB]:
     """Get current user if authenticated, otherwise return None."""
-    if not credentials:
+    if not credentials or credentials.scheme.lower() != "bearer":
         return None
 
     try:
-        # Create a new HTTPAuthorizationCredentials to pass to get_current_user
-        required_credentials = HTTPAuthorizationCredentials(
-            scheme="Bearer", credentials=credentials.credentials
-        )
-
-        # Mock the dependency to avoid circular issues
-        async def mock_security():
-            return required_credentials
-
-        # Get the current user
-        user = await get_current_user(required_credentials)
-        return user
-
+        return await get_current_user(credentials)
     except HTTPException:
         # If authentication fails, return None (don't raise exception)
         return None
@@ -208,7 +269,9 @@ async def get_optional_current_user(
         return None
 
 
-def get_pagination_params(page: int = 1, per_page: int = 20, max_per_page: int = 100):
+async def get_pagination_params(
+    page: int = 1, per_page: int = 20, max_per_page: int = 100
+):
     """Get pagination parameters with validation."""
     if page < 1:
         page = 1
@@ -221,7 +284,7 @@ def get_pagination_params(page: int = 1, per_page: int = 20, max_per_page: int =
     return {"page": page, "per_page": per_page}
 
 
-def get_search_params(
+async def get_search_params(
     query: Optional[str] = None, sort_by: str = "created_at", sort_order: str = "desc"
 ):
     """Get search parameters with validation."""
@@ -235,28 +298,9 @@ def get_search_params(
     }
 
 
-class DatabaseSession:
-    """Database session context manager."""
-
-    def __init__(self):
-        self.firestore_service = get_firestore_service()
-
-    def __enter__(self):
-        return self.firestore_service
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        # Cleanup if needed
-        pass
-
-
-def get_database() -> Generator[DatabaseSession, None, None]:
-    """Get database session."""
-    session = DatabaseSession()
-    try:
-        yield session
-    finally:
-        # Cleanup
-        pass
+async def get_database() -> FirestoreService:
+    """Get the Firestore service."""
+    return _firestore_service
 
 
 def validate_resource_access(
@@ -271,11 +315,11 @@ def validate_resource_access(
         return True
 
     # Admin can access if allowed
-    if allow_admin and "admin" in current_user.roles:
+    if allow_admin and "admin" in current_user.roles_set:
         return True
 
     # Moderator can access if allowed
-    if allow_moderator and "moderator" in current_user.roles:
+    if allow_moderator and "moderator" in current_user.roles_set:
         return True
 
     return False
@@ -286,7 +330,9 @@ def require_resource_access(
 ):
     """Dependency factory for resource access control."""
 
-    def access_checker(current_user: UserInDB = Depends(get_current_active_user)):
+    async def access_checker(
+        current_user: UserInDB = Depends(get_current_active_user),
+    ):
         if not validate_resource_access(
             resource_owner_uid, current_user, allow_admin, allow_moderator
         ):
@@ -304,36 +350,43 @@ def require_resource_access(
     return access_checker
 
 
-def rate_limit_key(
+def get_client_ip(request: Request) -> str:
+    """Get the client IP, honouring X-Forwarded-For from trusted proxies."""
+    forwarded_for = request.headers.get("x-forwarded-for")
+    if forwarded_for and settings.TRUSTED_PROXY_HOPS > 0:
+        # Leftmost entries are client-supplied; only trust those our proxies appended
+        hops = [hop.strip() for hop in forwarded_for.split(",")]
+        if len(hops) >= settings.TRUSTED_PROXY_HOPS:
+            return hops[-settings.TRUSTED_PROXY_HOPS]
+
+    return request.client.host if request.client else "unknown"
+
+
+async def rate_limit_key(
+    request: Request,
     current_user: Optional[UserInDB] = Depends(get_optional_current_user),
 ) -> str:
     """Generate rate limit key based on user or IP."""
     if current_user:
         return f"user:{current_user.uid}"
 
-    # In a real implementation, you would get the IP from request
-    # For now, return a default key
-    return "anonymous"
+    return f"ip:{get_client_ip(request)}"
 
 
-async def check_feature_flag(
-    feature_name: str,
-    current_user: Optional[UserInDB] = Depends(get_optional_current_user),
+def check_feature_flag(
+    feature_name: str, current_user: Optional[UserInDB] = None
 ) -> bool:
     """Check if a feature flag is enabled for the user."""
     # In a real implementation, you would check against a feature flag service
-    # For now, return True for all features
+    if current_user is None:
+        return False
 
     # You could implement different logic based on user roles, custom claims, etc.
-    if current_user and "beta_tester" in current_user.roles:
+    if "beta_tester" in current_user.roles_set:
         return True
 
     # Check custom claims for feature flags
-    if current_user and current_user.custom_claims:
-        feature_flags = current_user.custom_claims.get("feature_flags", {})
-        return feature_flags.get(feature_name, False)
-
-    return False
+    return current_user.feature_flags.get(feature_name, False)
 
 
 def require_feature_flag(feature_name: str):
@@ -342,9 +395,7 @@ def require_feature_flag(feature_name: str):
     async def feature_checker(
         current_user: UserInDB = Depends(get_current_active_user),
     ) -> UserInDB:
-        enabled = await check_feature_flag(feature_name, current_user)
-
-        if not enabled:
+        if not check_feature_flag(feature_name, current_user):
             log_security_event(
                 "feature_flag_denied", user_id=current_user.uid, feature=feature_name
             )
@@ -3,7 +3,7 @@ from typing import Any, Dict
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials
 
-from app.api.deps import get_current_active_user, security
+from app.api.deps import get_current_active_user, invalidate_cached_user, security
 from app.core.logging import get_logger, log_api_call, log_security_event
 from app.models.user import UserInDB
 from app.schemas.user import (
@@ -15,12 +15,14 @@ from app.schemas.user import (
     RegisterRequest,
     TokenResponse,
     UserResponse,
+    user_response_data,
 )
 from app.services.auth import get_auth_service
 from app.core.security import (
     create_access_token,
     create_refresh_token,
     verify_firebase_token,
+    verify_token,
     create_firebase_custom_token,
 )
 
@@ -56,7 +58,8 @@ async def register(
             "User registered successfully", uid=user["uid"], email=user_data.email
         )
 
-        return UserResponse(**user)
+        # Validated once against response_model instead of built here first
+        return user_response_data(user)
 
     except Exception as e:
         log_security_event("registration_failed", email=user_data.email, error=str(e))
@@ -100,9 +103,7 @@ async def login_with_firebase(
 
         logger.info("User logged in successfully", uid=uid, method="firebase")
 
-        return FirebaseTokenResponse(
-            custom_token=custom_token, user=UserResponse(**user)
-        )
+        return {"custom_token": custom_token, "user": user_response_data(user)}
 
     except HTTPException:
         raise
@@ -154,12 +155,12 @@ async def login(
             method="jwt",
         )
 
-        return TokenResponse(
-            access_token=access_token,
-            refresh_token=refresh_token,
-            expires_in=1800,  # 30 minutes
-            user=UserResponse(**user),
-        )
+        return {
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "expires_in": 1800,  # 30 minutes
+            "user": user_response_data(user),
+        }
 
     except HTTPException:
         raise
@@ -200,13 +201,14 @@ async def logout(
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
     current_user: UserInDB = Depends(get_current_active_user),
-) -> UserResponse:
+) -> UserInDB:
     """Get current user information."""
     log_api_call("get_current_user", "GET", user_id=current_user.uid)
 
     logger.info("Retrieved current user info", uid=current_user.uid)
 
-    return UserResponse.from_orm(current_user)
+    # Already validated; response_model filters it down to UserResponse
+    return current_user
 
 
 @router.post("/password/reset")
@@ -257,6 +259,7 @@ async def update_password(
         await auth_service.update_user(
             current_user.uid, password=password_data.new_password
         )
+        invalidate_cached_user(current_user.uid)
 
         log_security_event("password_updated", user_id=current_user.uid)
 
@@ -285,8 +288,6 @@ async def refresh_token(
     log_api_call("refresh_token", "POST")
 
     try:
-        from app.core.security import verify_token
-
         # Verify refresh token
         payload = verify_token(credentials.credentials)
 
@@ -1,7 +1,11 @@
-from datetime import datetime
+import asyncio
+from collections import Counter
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from firebase_admin import firestore
+from google.cloud.firestore_v1 import FieldFilter
 
 from app.api.deps import (
     get_current_active_user,
@@ -10,146 +14,268 @@ from app.api.deps import (
     require_moderator,
     validate_resource_access,
 )
+from app.core.config import settings
 from app.core.logging import get_logger, log_api_call
+from app.core.responses import PydanticJSONResponse
 from app.models.item import ItemStatus, ItemCategory, ItemPriority
 from app.models.user import UserInDB
 from app.schemas.item import (
-    BulkItemActionRequest,
     ItemCreateRequest,
     ItemInteractionRequest,
     ItemInteractionResponse,
     ItemListResponse,
     ItemResponse,
-    ItemSearchRequest,
     ItemStatsResponse,
-    ItemSummaryResponse,
     ItemUpdateRequest,
 )
+from app.services.firebase import get_firebase_app
 from app.services.firestore import get_firestore_service
-from app.utils.helpers import generate_id, generate_pagination_info, get_utc_now
+from app.utils.cache import AsyncTTLBytesCache
+from app.utils.helpers import (
+    create_background_task,
+    decode_cursor,
+    encode_cursor,
+    generate_id,
+    get_utc_now,
+)
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+# Up to this many items, stats come from one projection scan instead of a
+# count query per status/category/priority value
+STATS_SCAN_MAX_ITEMS = 1000
+
+# Stored values of each stats dimension, in response order
+ITEM_STATUSES = tuple(item_status.value for item_status in ItemStatus)
+ITEM_CATEGORIES = tuple(category.value for category in ItemCategory)
+ITEM_PRIORITIES = tuple(priority.value for priority in ItemPriority)
+
+# Firestore caps the number of values in an array-contains-any filter
+MAX_TAG_FILTERS = 10
+
+# Serialized stats response
+_stats_cache = AsyncTTLBytesCache(ttl=settings.ITEM_STATS_CACHE_TTL)
+
+# Item documents served by get_item; access checks still run per request.
+# Other instances may serve a stale copy for up to ITEM_CACHE_TTL seconds.
+_item_cache: TTLCache = TTLCache(
+    maxsize=settings.ITEM_CACHE_MAX_SIZE, ttl=settings.ITEM_CACHE_TTL
+)
+
+
+async def _get_cached_item(item_id: str) -> Optional[Dict[str, Any]]:
+    """Get an item document, reading Firestore only on a cache miss."""
+    item_data = _item_cache.get(item_id)
+    if item_data is None:
+        item_data = await get_firestore_service().get_document("items", item_id)
+        if not item_data:
+            return None
+        _item_cache[item_id] = item_data
+    # Callers adjust the copy for their response
+    return dict(item_data)
+
+
+def _item_summary_body(item_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build an ItemSummaryResponse body from a stored item document."""
+    return {
+        "id": item_data["id"],
+        "title": item_data["title"],
+        "category": item_data["category"],
+        "priority": item_data["priority"],
+        "status": item_data["status"],
+        "tags": item_data.get("tags", []),
+        "is_public": item_data.get("is_public", False),
+        "owner_uid": item_data["owner_uid"],
+        "created_at": item_data.get("created_at"),
+        "updated_at": item_data.get("updated_at"),
+        "view_count": item_data.get("view_count", 0),
+        "like_count": item_data.get("like_count", 0),
+    }
+
+
+def _item_body(item_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build an ItemResponse body from a stored item document."""
+    body = _item_summary_body(item_data)
+    body["description"] = item_data.get("description")
+    body["metadata"] = item_data.get("metadata", {})
+    body["share_count"] = item_data.get("share_count", 0)
+    return body
+
+
+def _cursor_start_after(cursor: str) -> Dict[str, Any]:
+    """Turn a next_cursor into the start_after position of a query."""
+    try:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+    return {"created_at": cursor_created_at, "__name__": cursor_id}
+
+
+def _parse_tags(tags: str) -> List[str]:
+    """Split a comma-separated tags filter into unique, normalized tags."""
+    tag_list = list(
+        dict.fromkeys(tag.strip().lower() for tag in tags.split(",") if tag.strip())
+    )
+    if len(tag_list) > MAX_TAG_FILTERS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_TAG_FILTERS} tags can be filtered on",
+        )
+    return tag_list
+
+
+def _tag_filter(tag_list: List[str]) -> Optional[Dict[str, Any]]:
+    """Build the filter matching items with any of the given tags."""
+    if not tag_list:
+        return None
+    if len(tag_list) == 1:
+        return {"field": "tags", "operator": "array_contains", "value": tag_list[0]}
+    return {"field": "tags", "operator": "array_contains_any", "value": tag_list}
+
+
+def _build_item_filters(
+    current_user: Optional[UserInDB],
+    *,
+    category: Optional[ItemCategory] = None,
+    item_status: Optional[ItemStatus] = None,
+    priority: Optional[ItemPriority] = None,
+    owner_uid: Optional[str] = None,
+    is_public: Optional[bool] = None,
+    tag_list: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """Build the Firestore filters for an item listing."""
+    filters = []
+
+    # Only show public items for non-authenticated users
+    if not current_user:
+        filters.append({"field": "is_public", "operator": "==", "value": True})
+    # For authenticated users, show their own items + public items
+    elif is_public is not None:
+        filters.append({"field": "is_public", "operator": "==", "value": is_public})
+    elif owner_uid is None:
+        # If no specific owner requested, show public items + user's own items
+        # This requires a compound query, for now just show public items
+        filters.append({"field": "is_public", "operator": "==", "value": True})
+
+    if category:
+        filters.append({"field": "category", "operator": "==", "value": category.value})
+    if item_status:
+        filters.append(
+            {"field": "status", "operator": "==", "value": item_status.value}
+        )
+    if priority:
+        filters.append({"field": "priority", "operator": "==", "value": priority.value})
+    if owner_uid:
+        # Only allow viewing specific user's items if it's the current user or admin
+        if current_user and validate_resource_access(
+            owner_uid, current_user, allow_admin=True, allow_moderator=True
+        ):
+            filters.append({"field": "owner_uid", "operator": "==", "value": owner_uid})
+        else:
+            # Add public filter for other users' items
+            filters.extend(
+                [
+                    {"field": "owner_uid", "operator": "==", "value": owner_uid},
+                    {"field": "is_public", "operator": "==", "value": True},
+                ]
+            )
+
+    tag_filter = _tag_filter(tag_list or [])
+    if tag_filter:
+        filters.append(tag_filter)
+
+    return filters
+
+
+async def _count_items(filters: List[Dict[str, Any]]) -> int:
+    """Count the items matching a listing's filters."""
+    return await get_firestore_service().get_collection_count("items", filters=filters)
+
 
 @router.get("", response_model=ItemListResponse)
 async def list_items(
     category: Optional[ItemCategory] = None,
-    status: Optional[ItemStatus] = None,
+    item_status: Optional[ItemStatus] = Query(None, alias="status"),
     priority: Optional[ItemPriority] = None,
-    tags: Optional[str] = Query(None, description="Comma-separated tags"),
+    tags: Optional[str] = Query(
+        None, description="Comma-separated tags; matches items with any of them"
+    ),
     search: Optional[str] = None,
     owner_uid: Optional[str] = None,
     is_public: Optional[bool] = None,
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page; replaces page"
+    ),
+    include_total: bool = Query(
+        False, description="Also count matching items on pages after the first"
+    ),
     pagination=Depends(get_pagination_params),
     current_user: Optional[UserInDB] = Depends(get_optional_current_user),
-) -> ItemListResponse:
-    """List items with filtering and pagination."""
+) -> PydanticJSONResponse:
+    """List items with filtering and pagination.
+
+    Items are stored in response shape, so the body is emitted straight from
+    the documents without building or re-validating response models.
+    """
     log_api_call(
         "list_items", "GET", user_id=current_user.uid if current_user else None
     )
 
+    start_after = _cursor_start_after(cursor) if cursor else None
+    tag_list = _parse_tags(tags) if tags else []
+
     try:
         firestore_service = get_firestore_service()
+        filters = _build_item_filters(
+            current_user,
+            category=category,
+            item_status=item_status,
+            priority=priority,
+            owner_uid=owner_uid,
+            is_public=is_public,
+            tag_list=tag_list,
+        )
 
-        # Build filters
-        filters = []
-
-        # Only show public items for non-authenticated users
-        if not current_user:
-            filters.append({"field": "is_public", "operator": "==", "value": True})
-        else:
-            # For authenticated users, show their own items + public items
-            if is_public is not None:
-                filters.append(
-                    {"field": "is_public", "operator": "==", "value": is_public}
-                )
-            elif owner_uid is None:
-                # If no specific owner requested, show public items + user's own items
-                # This requires a compound query, for now just show public items
-                filters.append({"field": "is_public", "operator": "==", "value": True})
-
-        if category:
-            filters.append(
-                {"field": "category", "operator": "==", "value": category.value}
-            )
-        if status:
-            filters.append({"field": "status", "operator": "==", "value": status.value})
-        if priority:
-            filters.append(
-                {"field": "priority", "operator": "==", "value": priority.value}
-            )
-        if owner_uid:
-            # Only allow viewing specific user's items if it's the current user or admin
-            if current_user and validate_resource_access(
-                owner_uid, current_user, allow_admin=True, allow_moderator=True
-            ):
-                filters.append(
-                    {"field": "owner_uid", "operator": "==", "value": owner_uid}
-                )
-            else:
-                # Add public filter for other users' items
-                filters.extend(
-                    [
-                        {"field": "owner_uid", "operator": "==", "value": owner_uid},
-                        {"field": "is_public", "operator": "==", "value": True},
-                    ]
-                )
-
-        if tags:
-            tag_list = [tag.strip().lower() for tag in tags.split(",") if tag.strip()]
-            if tag_list:
-                # For Firestore, we need to use array-contains for each tag
-                # For simplicity, just use the first tag
-                filters.append(
-                    {
-                        "field": "tags",
-                        "operator": "array-contains",
-                        "value": tag_list[0],
-                    }
-                )
-
-        # Query items
+        # Query items; cursor pages seek past the previous page instead of
+        # reading and discarding every earlier document via an offset
+        per_page = pagination["per_page"]
         items = await firestore_service.query_documents(
             collection="items",
             filters=filters,
             order_by="created_at",
             descending=True,
-            limit=pagination["per_page"],
-            offset=(pagination["page"] - 1) * pagination["per_page"],
+            limit=per_page + 1,
+            offset=None if cursor else (pagination["page"] - 1) * per_page,
+            start_after=start_after,
         )
 
-        # Convert to response models
+        has_next = len(items) > per_page
+        items = items[:per_page]
+
+        next_cursor = None
+        if has_next and items[-1].get("created_at"):
+            next_cursor = encode_cursor(items[-1]["created_at"], items[-1]["id"])
+
+        # Convert to response bodies
         item_summaries = []
         for item_data in items:
             try:
-                item_summary = ItemSummaryResponse(
-                    id=item_data["id"],
-                    title=item_data["title"],
-                    category=ItemCategory(item_data["category"]),
-                    priority=ItemPriority(item_data["priority"]),
-                    status=ItemStatus(item_data["status"]),
-                    tags=item_data.get("tags", []),
-                    is_public=item_data.get("is_public", False),
-                    owner_uid=item_data["owner_uid"],
-                    created_at=item_data.get("created_at"),
-                    updated_at=item_data.get("updated_at"),
-                    view_count=item_data.get("view_count", 0),
-                    like_count=item_data.get("like_count", 0),
-                )
-                item_summaries.append(item_summary)
-            except Exception as e:
+                item_summaries.append(_item_summary_body(item_data))
+            except KeyError as e:
                 logger.warning(
                     "Failed to parse item", item_id=item_data.get("id"), error=str(e)
                 )
                 continue
 
-        # Get total count (for pagination)
-        total = await firestore_service.get_collection_count("items", filters=filters)
-
-        pagination_info = generate_pagination_info(
-            total, pagination["page"], pagination["per_page"]
-        )
+        # Counting scans the whole index, so only the first page does it unless
+        # asked; clients keep the total from there
+        total = None
+        if include_total or (not cursor and pagination["page"] == 1):
+            total = await _count_items(filters)
 
         logger.info(
             "Items listed",
@@ -158,12 +284,15 @@ async def list_items(
             user_id=current_user.uid if current_user else None,
         )
 
-        return ItemListResponse(
-            items=item_summaries,
-            total=total,
-            page=pagination["page"],
-            per_page=pagination["per_page"],
-            has_next=pagination_info["has_next"],
+        return PydanticJSONResponse(
+            {
+                "items": item_summaries,
+                "total": total,
+                "page": pagination["page"],
+                "per_page": per_page,
+                "has_next": has_next,
+                "next_cursor": next_cursor,
+            }
         )
 
     except Exception as e:
@@ -178,15 +307,13 @@ async def list_items(
 async def get_item(
     item_id: str,
     current_user: Optional[UserInDB] = Depends(get_optional_current_user),
-) -> ItemResponse:
+) -> PydanticJSONResponse:
     """Get item by ID."""
     log_api_call("get_item", "GET", user_id=current_user.uid if current_user else None)
 
     try:
-        firestore_service = get_firestore_service()
-
         # Get item
-        item_data = await firestore_service.get_document("items", item_id)
+        item_data = await _get_cached_item(item_id)
 
         if not item_data:
             raise HTTPException(
@@ -196,8 +323,8 @@ async def get_item(
         # Check if user can access this item
         is_owner = current_user and item_data["owner_uid"] == current_user.uid
         is_public = item_data.get("is_public", False)
-        is_admin = current_user and "admin" in current_user.roles
-        is_moderator = current_user and "moderator" in current_user.roles
+        is_admin = current_user and "admin" in current_user.roles_set
+        is_moderator = current_user and "moderator" in current_user.roles_set
 
         if not (is_public or is_owner or is_admin or is_moderator):
             raise HTTPException(
@@ -205,16 +332,14 @@ async def get_item(
                 detail="You don't have permission to view this item",
             )
 
-        # Increment view count
-        if current_user and item_data["owner_uid"] != current_user.uid:
-            await firestore_service.update_document(
-                "items", item_id, {"view_count": item_data.get("view_count", 0) + 1}
-            )
-            item_data["view_count"] = item_data.get("view_count", 0) + 1
-
-        # Record view interaction
+        # Record the view (and count it for non-owners) without blocking the response
         if current_user:
-            await record_item_interaction(item_id, current_user.uid, "view")
+            count_view = item_data["owner_uid"] != current_user.uid
+            create_background_task(
+                record_item_view(item_id, current_user.uid, count_view)
+            )
+            if count_view:
+                item_data["view_count"] = item_data.get("view_count", 0) + 1
 
         logger.info(
             "Item retrieved",
@@ -223,23 +348,7 @@ async def get_item(
             user_id=current_user.uid if current_user else None,
         )
 
-        return ItemResponse(
-            id=item_data["id"],
-            title=item_data["title"],
-            description=item_data.get("description"),
-            category=ItemCategory(item_data["category"]),
-            priority=ItemPriority(item_data["priority"]),
-            status=ItemStatus(item_data["status"]),
-            tags=item_data.get("tags", []),
-            metadata=item_data.get("metadata", {}),
-            is_public=item_data.get("is_public", False),
-            owner_uid=item_data["owner_uid"],
-            created_at=item_data.get("created_at"),
-            updated_at=item_data.get("updated_at"),
-            view_count=item_data.get("view_count", 0),
-            like_count=item_data.get("like_count", 0),
-            share_count=item_data.get("share_count", 0),
-        )
+        return PydanticJSONResponse(_item_body(item_data))
 
     except HTTPException:
         raise
@@ -255,7 +364,7 @@ async def get_item(
 async def create_item(
     item_data: ItemCreateRequest,
     current_user: UserInDB = Depends(get_current_active_user),
-) -> ItemResponse:
+) -> PydanticJSONResponse:
     """Create new item."""
     log_api_call("create_item", "POST", user_id=current_user.uid)
 
@@ -297,23 +406,7 @@ async def create_item(
         item_doc_data["created_at"] = now
         item_doc_data["updated_at"] = now
 
-        return ItemResponse(
-            id=item_id,
-            title=item_data.title,
-            description=item_data.description,
-            category=item_data.category,
-            priority=item_data.priority,
-            status=item_data.status,
-            tags=item_data.tags,
-            metadata=item_data.metadata,
-            is_public=item_data.is_public,
-            owner_uid=current_user.uid,
-            created_at=now,
-            updated_at=now,
-            view_count=0,
-            like_count=0,
-            share_count=0,
-        )
+        return PydanticJSONResponse(_item_body(item_doc_data))
 
     except Exception as e:
         logger.error(
@@ -330,7 +423,7 @@ async def update_item(
     item_id: str,
     item_update: ItemUpdateRequest,
     current_user: UserInDB = Depends(get_current_active_user),
-) -> ItemResponse:
+) -> PydanticJSONResponse:
     """Update item."""
     log_api_call("update_item", "PUT", user_id=current_user.uid)
 
@@ -356,17 +449,21 @@ async def update_item(
 
         # Prepare update data
         update_data = {}
-        for field, value in item_update.dict(exclude_unset=True).items():
+        for field, value in item_update.model_dump(exclude_unset=True).items():
             if field in ["category", "priority", "status"] and value is not None:
                 update_data[field] = value.value
             elif value is not None:
                 update_data[field] = value
 
+        # Stamp the update locally so the response can be built without
+        # reading the document back
+        update_data["updated_at"] = get_utc_now()
+
         # Update item
         await firestore_service.update_document("items", item_id, update_data)
+        _item_cache.pop(item_id, None)
 
-        # Get updated item
-        updated_item_data = await firestore_service.get_document("items", item_id)
+        item_data.update(update_data)
 
         logger.info(
             "Item updated",
@@ -376,23 +473,7 @@ async def update_item(
             fields_updated=list(update_data.keys()),
         )
 
-        return ItemResponse(
-            id=updated_item_data["id"],
-            title=updated_item_data["title"],
-            description=updated_item_data.get("description"),
-            category=ItemCategory(updated_item_data["category"]),
-            priority=ItemPriority(updated_item_data["priority"]),
-            status=ItemStatus(updated_item_data["status"]),
-            tags=updated_item_data.get("tags", []),
-            metadata=updated_item_data.get("metadata", {}),
-            is_public=updated_item_data.get("is_public", False),
-            owner_uid=updated_item_data["owner_uid"],
-            created_at=updated_item_data.get("created_at"),
-            updated_at=updated_item_data.get("updated_at"),
-            view_count=updated_item_data.get("view_count", 0),
-            like_count=updated_item_data.get("like_count", 0),
-            share_count=updated_item_data.get("share_count", 0),
-        )
+        return PydanticJSONResponse(_item_body(item_data))
 
     except HTTPException:
         raise
@@ -440,6 +521,7 @@ async def delete_item(
 
         # Delete item
         await firestore_service.delete_document("items", item_id)
+        _item_cache.pop(item_id, None)
 
         # TODO: Delete related data (interactions, etc.)
 
@@ -503,37 +585,46 @@ async def interact_with_item(
         new_count = 0
         message = ""
 
-        if interaction.interaction_type == "like":
-            # Check if already liked (in a real app, you'd check interactions collection)
-            new_count = item_data.get("like_count", 0) + 1
-            await firestore_service.update_document(
-                "items", item_id, {"like_count": new_count}
-            )
-            await record_item_interaction(
-                item_id, current_user.uid, "like", interaction.metadata
+        # Counters are bumped server-side, so concurrent interactions are not lost;
+        # new_count is reported from the value read above
+        if interaction.interaction_type in ("like", "share"):
+            count_field = f"{interaction.interaction_type}_count"
+            new_count = item_data.get(count_field, 0) + 1
+            await firestore_service.batch_write(
+                [
+                    _increment_operation(item_id, count_field, 1),
+                    {
+                        "type": "create",
+                        "collection": "item_interactions",
+                        "document_id": generate_id(),
+                        "data": _interaction_data(
+                            item_id,
+                            current_user.uid,
+                            interaction.interaction_type,
+                            interaction.metadata,
+                        ),
+                    },
+                ]
             )
             success = True
-            message = "Item liked"
-
-        elif interaction.interaction_type == "unlike":
-            new_count = max(0, item_data.get("like_count", 0) - 1)
-            await firestore_service.update_document(
-                "items", item_id, {"like_count": new_count}
+            message = (
+                "Item liked"
+                if interaction.interaction_type == "like"
+                else "Item shared"
             )
-            # TODO: Remove like interaction record
-            success = True
-            message = "Item unliked"
 
-        elif interaction.interaction_type == "share":
-            new_count = item_data.get("share_count", 0) + 1
-            await firestore_service.update_document(
-                "items", item_id, {"share_count": new_count}
-            )
-            await record_item_interaction(
-                item_id, current_user.uid, "share", interaction.metadata
-            )
+        elif interaction.interaction_type == "unlike":
+            new_count = item_data.get("like_count", 0)
+            # Only take back a like this user actually gave; the lookup runs in
+            # the transaction so concurrent unlikes cannot both decrement
+            if await firestore_service.run_transaction(
+                _unlike_item, item_id, current_user.uid
+            ):
+                new_count = max(0, new_count - 1)
+                message = "Item unliked"
+            else:
+                message = "Item was not liked"
             success = True
-            message = "Item shared"
 
         else:
             raise HTTPException(
@@ -541,6 +632,8 @@ async def interact_with_item(
                 detail=f"Unknown interaction type: {interaction.interaction_type}",
             )
 
+        _item_cache.pop(item_id, None)
+
         logger.info(
             "Item interaction recorded",
             item_id=item_id,
@@ -574,96 +667,162 @@ async def interact_with_item(
         )
 
 
-async def record_item_interaction(
+def _increment_operation(item_id: str, field: str, amount: int) -> Dict[str, Any]:
+    """Build a batch_write operation that atomically adjusts an item counter."""
+    return {
+        "type": "update",
+        "collection": "items",
+        "document_id": item_id,
+        "data": {field: firestore.Increment(amount)},
+    }
+
+
+def _unlike_item(transaction, item_id: str, user_uid: str) -> bool:
+    """Delete a user's like and decrement like_count in a transaction.
+
+    Returns whether there was a like to take back.
+    """
+    client = firestore.client(app=get_firebase_app())
+    likes_query = (
+        client.collection("item_interactions")
+        .where(filter=FieldFilter("item_id", "==", item_id))
+        .where(filter=FieldFilter("user_uid", "==", user_uid))
+        .where(filter=FieldFilter("interaction_type", "==", "like"))
+        .limit(1)
+    )
+    likes = list(transaction.get(likes_query))
+    if not likes:
+        return False
+
+    transaction.delete(likes[0].reference)
+    transaction.update(
+        client.collection("items").document(item_id),
+        {"like_count": firestore.Increment(-1)},
+    )
+    return True
+
+
+def _interaction_data(
     item_id: str,
     user_uid: str,
     interaction_type: str,
     metadata: Optional[Dict[str, Any]] = None,
-):
-    """Record item interaction."""
-    try:
-        firestore_service = get_firestore_service()
-
-        interaction_data = {
-            "item_id": item_id,
-            "user_uid": user_uid,
-            "interaction_type": interaction_type,
-            "timestamp": get_utc_now(),
-            "metadata": metadata or {},
+) -> Dict[str, Any]:
+    """Build an item_interactions document."""
+    return {
+        "item_id": item_id,
+        "user_uid": user_uid,
+        "interaction_type": interaction_type,
+        "timestamp": get_utc_now(),
+        "metadata": metadata or {},
+    }
+
+
+async def record_item_view(item_id: str, user_uid: str, count_view: bool) -> None:
+    """Record a view interaction and bump the view count in one batch write."""
+    operations = [
+        {
+            "type": "create",
+            "collection": "item_interactions",
+            "document_id": generate_id(),
+            "data": _interaction_data(item_id, user_uid, "view"),
         }
+    ]
+    if count_view:
+        operations.append(_increment_operation(item_id, "view_count", 1))
 
-        await firestore_service.create_document(
-            "item_interactions", generate_id(), interaction_data
-        )
-
+    try:
+        await get_firestore_service().batch_write(operations)
     except Exception as e:
         logger.error(
-            "Failed to record interaction",
+            "Failed to record item view",
             item_id=item_id,
             user_uid=user_uid,
-            interaction_type=interaction_type,
             error=str(e),
         )
+        return
+
+    if count_view:
+        # Evict rather than bump the cached copy; it may already have been
+        # refilled with this view counted
+        _item_cache.pop(item_id, None)
 
 
 @router.get("/stats/overview", response_model=ItemStatsResponse)
 async def get_item_stats(
     current_user: UserInDB = Depends(require_moderator()),
-) -> ItemStatsResponse:
-    """Get item statistics (admin/moderator only)."""
+) -> Response:
+    """Get item statistics (admin/moderator only).
+
+    The serialized response is cached for ITEM_STATS_CACHE_TTL seconds, as
+    the numbers change slowly and each computation costs many Firestore reads.
+    """
     log_api_call("get_item_stats", "GET", user_id=current_user.uid)
 
+    async def load_stats() -> bytes:
+        stats = await _compute_item_stats(current_user)
+        return stats.model_dump_json().encode()
+
+    content = await _stats_cache.get(load_stats)
+    return Response(content=content, media_type="application/json")
+
+
+async def _compute_item_stats(current_user: UserInDB) -> ItemStatsResponse:
+    """Compute item statistics from Firestore."""
     try:
         firestore_service = get_firestore_service()
 
-        # Get total count
         total_items = await firestore_service.get_collection_count("items")
 
-        # Get counts by status
-        items_by_status = {}
-        for status_value in ItemStatus:
-            count = await firestore_service.get_collection_count(
-                "items",
-                filters=[
-                    {"field": "status", "operator": "==", "value": status_value.value}
-                ],
+        if total_items <= STATS_SCAN_MAX_ITEMS:
+            # One query reading four fields per item, tallied in a single pass
+            docs = await firestore_service.project_documents(
+                "items", fields=["status", "category", "priority", "is_public"]
             )
-            items_by_status[status_value.value] = count
-
-        # Get counts by category
-        items_by_category = {}
-        for category_value in ItemCategory:
-            count = await firestore_service.get_collection_count(
-                "items",
-                filters=[
-                    {
-                        "field": "category",
-                        "operator": "==",
-                        "value": category_value.value,
-                    }
-                ],
-            )
-            items_by_category[category_value.value] = count
-
-        # Get counts by priority
-        items_by_priority = {}
-        for priority_value in ItemPriority:
-            count = await firestore_service.get_collection_count(
-                "items",
-                filters=[
-                    {
-                        "field": "priority",
-                        "operator": "==",
-                        "value": priority_value.value,
-                    }
-                ],
+            status_counts: Counter = Counter()
+            category_counts: Counter = Counter()
+            priority_counts: Counter = Counter()
+            public_items = 0
+            for doc in docs:
+                status_counts[doc.get("status")] += 1
+                category_counts[doc.get("category")] += 1
+                priority_counts[doc.get("priority")] += 1
+                if doc.get("is_public") is True:
+                    public_items += 1
+
+            # The scan may have raced with writes; keep the totals consistent
+            total_items = len(docs)
+            items_by_status = {value: status_counts[value] for value in ITEM_STATUSES}
+            items_by_category = {
+                value: category_counts[value] for value in ITEM_CATEGORIES
+            }
+            items_by_priority = {
+                value: priority_counts[value] for value in ITEM_PRIORITIES
+            }
+        else:
+
+            def count_where(field: str, value: Any):
+                return firestore_service.get_collection_count(
+                    "items",
+                    filters=[{"field": field, "operator": "==", "value": value}],
+                )
+
+            # Issue every count query at once rather than one round trip at a time
+            counts = iter(
+                await asyncio.gather(
+                    count_where("is_public", True),
+                    *(count_where("status", value) for value in ITEM_STATUSES),
+                    *(count_where("category", value) for value in ITEM_CATEGORIES),
+                    *(count_where("priority", value) for value in ITEM_PRIORITIES),
+                )
             )
-            items_by_priority[priority_value.value] = count
 
-        # Get public/private counts
-        public_items = await firestore_service.get_collection_count(
-            "items", filters=[{"field": "is_public", "operator": "==", "value": True}]
-        )
+            # Results come back in submission order
+            public_items = next(counts)
+            items_by_status = {value: next(counts) for value in ITEM_STATUSES}
+            items_by_category = {value: next(counts) for value in ITEM_CATEGORIES}
+            items_by_priority = {value: next(counts) for value in ITEM_PRIORITIES}
+
         private_items = total_items - public_items
 
         logger.info(
@@ -1,15 +1,17 @@
+import asyncio
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from app.api.deps import (
     get_current_active_user,
     get_pagination_params,
-    get_search_params,
+    invalidate_cached_user,
     require_admin,
     require_moderator,
     validate_resource_access,
 )
+from app.core.config import settings
 from app.core.logging import get_logger, log_api_call, log_security_event
 from app.models.user import UserInDB
 from app.schemas.user import (
@@ -25,15 +27,29 @@ from app.schemas.user import (
     UserSearchRequest,
     UserStatsResponse,
     UserUpdateRequest,
-    UserActivityResponse,
+    user_response_data,
 )
 from app.services.auth import get_auth_service
 from app.services.firestore import get_firestore_service
-from app.utils.helpers import generate_pagination_info
+from app.utils.cache import AsyncTTLBytesCache
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+# Most users a bulk action updates in Firebase at the same time; half the auth
+# executor, so user lookups for other requests still get a thread
+BULK_ACTION_CONCURRENCY = settings.AUTH_EXECUTOR_WORKERS // 2
+
+# Firebase Auth fields each bulk update action sets
+BULK_UPDATE_ACTIONS: Dict[str, Dict[str, bool]] = {
+    "disable": {"disabled": True},
+    "enable": {"disabled": False},
+    "verify_email": {"email_verified": True},
+}
+
+# Serialized stats response
+_stats_cache = AsyncTTLBytesCache(ttl=settings.USER_STATS_CACHE_TTL)
+
 
 @router.get("/me", response_model=UserResponse)
 async def get_my_profile(
@@ -42,7 +58,7 @@ async def get_my_profile(
     """Get current user's profile."""
     log_api_call("get_my_profile", "GET", user_id=current_user.uid)
 
-    return UserResponse.from_orm(current_user)
+    return UserResponse.from_user(current_user)
 
 
 @router.put("/me", response_model=UserResponse)
@@ -68,14 +84,15 @@ async def update_my_profile(
             update_data["photo_url"] = user_update.photo_url
 
         if user_update.profile is not None:
-            profile_data["profile"] = user_update.profile.dict()
+            profile_data["profile"] = user_update.profile.model_dump()
         if user_update.preferences is not None:
-            profile_data["preferences"] = user_update.preferences.dict()
+            profile_data["preferences"] = user_update.preferences.model_dump()
 
         # Update user
         updated_user = await auth_service.update_user(
             current_user.uid, profile_data=profile_data, **update_data
         )
+        invalidate_cached_user(current_user.uid)
 
         logger.info(
             "User profile updated",
@@ -83,8 +100,10 @@ async def update_my_profile(
             fields_updated=list(update_data.keys()) + list(profile_data.keys()),
         )
 
-        return UserResponse(**updated_user)
+        return UserResponse.model_validate(updated_user)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "Profile update failed", uid=current_user.uid, error=str(e), exc_info=e
@@ -107,25 +126,26 @@ async def update_my_profile_details(
         auth_service = get_auth_service()
 
         # Update profile data in Firestore
-        profile_data = {
-            "profile": {
-                **current_user.profile.dict(),
-                **profile_update.dict(exclude_unset=True),
-            }
-        }
+        changes = profile_update.model_dump(exclude_unset=True)
+        profile = current_user.profile.model_dump()
+        profile.update(changes)
+        profile_data = {"profile": profile}
 
         updated_user = await auth_service.update_user(
             current_user.uid, profile_data=profile_data
         )
+        invalidate_cached_user(current_user.uid)
 
         logger.info(
             "User profile details updated",
             uid=current_user.uid,
-            fields_updated=list(profile_update.dict(exclude_unset=True).keys()),
+            fields_updated=list(changes.keys()),
         )
 
-        return UserResponse(**updated_user)
+        return UserResponse.model_validate(updated_user)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "Profile details update failed",
@@ -151,25 +171,26 @@ async def update_my_preferences(
         auth_service = get_auth_service()
 
         # Update preferences data in Firestore
-        profile_data = {
-            "preferences": {
-                **current_user.preferences.dict(),
-                **preferences_update.dict(exclude_unset=True),
-            }
-        }
+        changes = preferences_update.model_dump(exclude_unset=True)
+        preferences = current_user.preferences.model_dump()
+        preferences.update(changes)
+        profile_data = {"preferences": preferences}
 
         updated_user = await auth_service.update_user(
             current_user.uid, profile_data=profile_data
         )
+        invalidate_cached_user(current_user.uid)
 
         logger.info(
             "User preferences updated",
             uid=current_user.uid,
-            fields_updated=list(preferences_update.dict(exclude_unset=True).keys()),
+            fields_updated=list(changes.keys()),
         )
 
-        return UserResponse(**updated_user)
+        return UserResponse.model_validate(updated_user)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "Preferences update failed", uid=current_user.uid, error=str(e), exc_info=e
@@ -192,6 +213,7 @@ async def delete_my_account(
 
         # Delete user account
         await auth_service.delete_user(current_user.uid)
+        invalidate_cached_user(current_user.uid)
 
         log_security_event("user_self_deleted", user_id=current_user.uid)
 
@@ -199,6 +221,8 @@ async def delete_my_account(
 
         return {"message": "Account deleted successfully"}
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "Account deletion failed", uid=current_user.uid, error=str(e), exc_info=e
@@ -217,6 +241,10 @@ async def get_user_by_id(
     """Get user by UID (admins can see any user, users can only see themselves)."""
     log_api_call("get_user_by_id", "GET", user_id=current_user.uid)
 
+    # Looking yourself up needs no access check or fresh read, same as /me
+    if user_uid == current_user.uid:
+        return UserResponse.from_user(current_user)
+
     # Check access permissions
     if not validate_resource_access(
         user_uid, current_user, allow_admin=True, allow_moderator=True
@@ -240,7 +268,7 @@ async def get_user_by_id(
 
         logger.info("User retrieved", uid=user_uid, requested_by=current_user.uid)
 
-        return UserResponse(**user)
+        return UserResponse.model_validate(user)
 
     except HTTPException:
         raise
@@ -256,10 +284,17 @@ async def get_user_by_id(
 @router.get("", response_model=UserListResponse)
 async def list_users(
     search: UserSearchRequest = Depends(),
+    page_token: Optional[str] = Query(
+        None, description="next_page_token from the previous page"
+    ),
     pagination=Depends(get_pagination_params),
     current_user: UserInDB = Depends(require_moderator()),
 ) -> UserListResponse:
-    """List users (admin/moderator only)."""
+    """List users (admin/moderator only).
+
+    Pages are fetched with Firebase Auth page tokens; the page number is
+    only echoed back.
+    """
     log_api_call("list_users", "GET", user_id=current_user.uid)
 
     try:
@@ -267,11 +302,14 @@ async def list_users(
 
         # Get users from Firebase Auth with pagination
         result = await auth_service.list_users(
-            page_token=None,  # Implement proper pagination with tokens
+            page_token=page_token,
             max_results=pagination["per_page"],
         )
 
-        users = [UserResponse(**user_data) for user_data in result["users"]]
+        users = [
+            UserResponse.model_validate(user_response_data(user_data))
+            for user_data in result["users"]
+        ]
 
         # Apply filters if needed (implement in auth service)
         # For now, return all users
@@ -280,12 +318,14 @@ async def list_users(
 
         return UserListResponse(
             users=users,
-            total=len(users),
             page=pagination["page"],
             per_page=pagination["per_page"],
             has_next=bool(result["next_page_token"]),
+            next_page_token=result["next_page_token"] or None,
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("Failed to list users", error=str(e), exc_info=e)
         raise HTTPException(
@@ -330,8 +370,10 @@ async def create_user(
             email=user_data.email,
         )
 
-        return UserResponse(**user)
+        return UserResponse.model_validate(user)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "Failed to create user",
@@ -359,19 +401,20 @@ async def update_user(
         auth_service = get_auth_service()
 
         # Prepare update data
-        update_data = user_update.dict(
+        update_data = user_update.model_dump(
             exclude_unset=True, exclude={"profile", "preferences"}
         )
         profile_data = {}
 
         if user_update.profile is not None:
-            profile_data["profile"] = user_update.profile.dict()
+            profile_data["profile"] = user_update.profile.model_dump()
         if user_update.preferences is not None:
-            profile_data["preferences"] = user_update.preferences.dict()
+            profile_data["preferences"] = user_update.preferences.model_dump()
 
         updated_user = await auth_service.update_user(
             user_uid, profile_data=profile_data, **update_data
         )
+        invalidate_cached_user(user_uid)
 
         log_security_event(
             "user_updated_by_admin",
@@ -387,8 +430,10 @@ async def update_user(
             fields_updated=list(update_data.keys()) + list(profile_data.keys()),
         )
 
-        return UserResponse(**updated_user)
+        return UserResponse.model_validate(updated_user)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "Failed to update user",
@@ -421,6 +466,7 @@ async def delete_user(
     try:
         auth_service = get_auth_service()
         await auth_service.delete_user(user_uid)
+        invalidate_cached_user(user_uid)
 
         log_security_event(
             "user_deleted_by_admin", user_id=current_user.uid, deleted_user=user_uid
@@ -432,6 +478,8 @@ async def delete_user(
 
         return {"message": "User deleted successfully"}
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "Failed to delete user",
@@ -465,6 +513,7 @@ async def assign_roles(
             custom_claims=custom_claims,
             profile_data={"roles": role_data.roles},
         )
+        invalidate_cached_user(role_data.user_uid)
 
         log_security_event(
             "roles_assigned",
@@ -482,6 +531,8 @@ async def assign_roles(
 
         return {"message": "Roles assigned successfully"}
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "Failed to assign roles",
@@ -510,6 +561,7 @@ async def update_custom_claims(
         await auth_service.update_user(
             claims_data.user_uid, custom_claims=claims_data.custom_claims
         )
+        invalidate_cached_user(claims_data.user_uid)
 
         log_security_event(
             "custom_claims_updated",
@@ -527,6 +579,8 @@ async def update_custom_claims(
 
         return {"message": "Custom claims updated successfully"}
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "Failed to update custom claims",
@@ -559,57 +613,47 @@ async def bulk_user_action(
     try:
         auth_service = get_auth_service()
 
-        success_count = 0
-        failed_users = []
+        if action_data.action == "delete":
+            # One batched call instead of a round-trip per user
+            failures = await auth_service.delete_users(
+                action_data.user_uids, on_deleted=invalidate_cached_user
+            )
 
-        for user_uid in action_data.user_uids:
+            failed_users = [
+                {"uid": user_uid, "error": error}
+                for user_uid, error in failures.items()
+            ]
+            return _bulk_action_result(action_data, current_user, failed_users)
+
+        update_fields = BULK_UPDATE_ACTIONS[action_data.action]
+        semaphore = asyncio.Semaphore(BULK_ACTION_CONCURRENCY)
+
+        async def apply_action(user_uid: str) -> Optional[Dict[str, str]]:
+            """Apply the action to one user, returning a failure entry if it fails."""
             try:
-                if action_data.action == "disable":
-                    await auth_service.update_user(user_uid, disabled=True)
-                elif action_data.action == "enable":
-                    await auth_service.update_user(user_uid, disabled=False)
-                elif action_data.action == "delete":
-                    await auth_service.delete_user(user_uid)
-                elif action_data.action == "verify_email":
-                    await auth_service.update_user(user_uid, email_verified=True)
-                else:
-                    raise ValueError(f"Unknown action: {action_data.action}")
-
-                success_count += 1
+                async with semaphore:
+                    await auth_service.update_user(user_uid, **update_fields)
+
+                invalidate_cached_user(user_uid)
+                return None
 
             except Exception as e:
-                failed_users.append({"uid": user_uid, "error": str(e)})
                 logger.error(
                     "Bulk action failed for user",
                     user_uid=user_uid,
                     action=action_data.action,
                     error=str(e),
                 )
+                return {"uid": user_uid, "error": str(e)}
 
-        log_security_event(
-            "bulk_user_action",
-            user_id=current_user.uid,
-            action=action_data.action,
-            total_users=len(action_data.user_uids),
-            success_count=success_count,
-            failed_count=len(failed_users),
+        results = await asyncio.gather(
+            *(apply_action(user_uid) for user_uid in action_data.user_uids)
         )
+        failed_users = [result for result in results if result is not None]
+        return _bulk_action_result(action_data, current_user, failed_users)
 
-        logger.info(
-            "Bulk user action completed",
-            admin_user=current_user.uid,
-            action=action_data.action,
-            success_count=success_count,
-            failed_count=len(failed_users),
-        )
-
-        return {
-            "message": "Bulk action completed",
-            "success_count": success_count,
-            "failed_count": len(failed_users),
-            "failed_users": failed_users,
-        }
-
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "Bulk user action failed",
@@ -624,31 +668,74 @@ async def bulk_user_action(
         )
 
 
+def _bulk_action_result(
+    action_data: BulkUserActionRequest,
+    current_user: UserInDB,
+    failed_users: List[Dict[str, str]],
+) -> Dict[str, Any]:
+    """Log a finished bulk action and build its response."""
+    success_count = len(action_data.user_uids) - len(failed_users)
+
+    log_security_event(
+        "bulk_user_action",
+        user_id=current_user.uid,
+        action=action_data.action,
+        total_users=len(action_data.user_uids),
+        success_count=success_count,
+        failed_count=len(failed_users),
+    )
+
+    logger.info(
+        "Bulk user action completed",
+        admin_user=current_user.uid,
+        action=action_data.action,
+        success_count=success_count,
+        failed_count=len(failed_users),
+    )
+
+    return {
+        "message": "Bulk action completed",
+        "success_count": success_count,
+        "failed_count": len(failed_users),
+        "failed_users": failed_users,
+    }
+
+
 @router.get("/stats/overview", response_model=UserStatsResponse)
 async def get_user_stats(
     current_user: UserInDB = Depends(require_moderator()),
-) -> UserStatsResponse:
-    """Get user statistics (admin/moderator only)."""
+) -> Response:
+    """Get user statistics (admin/moderator only).
+
+    The serialized response is cached for USER_STATS_CACHE_TTL seconds, so
+    polling dashboards do not re-run the count queries on every request.
+    """
     log_api_call("get_user_stats", "GET", user_id=current_user.uid)
 
-    try:
-        # In a real implementation, you would query the database for these stats
-        # For now, return mock data
+    async def load_stats() -> bytes:
+        stats = await _compute_user_stats(current_user)
+        return stats.model_dump_json().encode()
 
-        firestore_service = get_firestore_service()
+    content = await _stats_cache.get(load_stats)
+    return Response(content=content, media_type="application/json")
 
-        # Get total user count
-        total_users = await firestore_service.get_collection_count("users")
 
-        # Get active users (not disabled)
-        active_users = await firestore_service.get_collection_count(
-            "users", filters=[{"field": "disabled", "operator": "==", "value": False}]
-        )
+async def _compute_user_stats(current_user: UserInDB) -> UserStatsResponse:
+    """Compute user statistics from Firestore."""
+    try:
+        firestore_service = get_firestore_service()
 
-        # Get verified users
-        verified_users = await firestore_service.get_collection_count(
-            "users",
-            filters=[{"field": "email_verified", "operator": "==", "value": True}],
+        # Total, active (not disabled) and verified counts, queried concurrently
+        total_users, active_users, verified_users = await asyncio.gather(
+            firestore_service.get_collection_count("users"),
+            firestore_service.get_collection_count(
+                "users",
+                filters=[{"field": "disabled", "operator": "==", "value": False}],
+            ),
+            firestore_service.get_collection_count(
+                "users",
+                filters=[{"field": "email_verified", "operator": "==", "value": True}],
+            ),
         )
 
         logger.info(
@@ -666,6 +753,8 @@ async def get_user_stats(
             users_by_provider={"email": total_users},  # Implement provider grouping
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "Failed to get user stats",
@@ -1,9 +1,17 @@
-import os
+import json
+from functools import cached_property
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Origins allowed when BACKEND_CORS_ORIGINS is unset or empty
+DEFAULT_CORS_ORIGINS = (
+    "http://localhost:3000",
+    "http://localhost:8000",
+    "http://localhost:8080",
+)
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -29,11 +37,7 @@ class Settings(BaseSettings):
 
     # CORS Settings
     BACKEND_CORS_ORIGINS: Union[List[str], str] = Field(
-        default=[
-            "http://localhost:3000",
-            "http://localhost:8000",
-            "http://localhost:8080",
-        ],
+        default=list(DEFAULT_CORS_ORIGINS),
         description="List of allowed origins for CORS",
     )
 
@@ -44,17 +48,16 @@ class Settings(BaseSettings):
             return v
         if isinstance(v, str):
             if not v or v.strip() == "":
-                return ["http://localhost:3000", "http://localhost:8000", "http://localhost:8080"]
+                return list(DEFAULT_CORS_ORIGINS)
             # Handle JSON array format
             if v.strip().startswith("["):
                 try:
-                    import json
                     return json.loads(v)
                 except json.JSONDecodeError:
                     pass
             # Handle comma-separated format
             return [i.strip() for i in v.split(",") if i.strip()]
-        return ["http://localhost:3000", "http://localhost:8000", "http://localhost:8080"]
+        return list(DEFAULT_CORS_ORIGINS)
 
     # Firebase Settings
     FIREBASE_PROJECT_ID: str = Field(description="Firebase project ID")
@@ -64,6 +67,14 @@ class Settings(BaseSettings):
     FIREBASE_DATABASE_URL: Optional[str] = Field(
         default=None, description="Firebase Realtime Database URL"
     )
+    FIREBASE_WARM_CERTS: bool = Field(
+        default=True, description="Fetch Firebase ID token public keys at startup"
+    )
+    FIRESTORE_CLIENT_POOL_SIZE: int = Field(
+        default=4,
+        ge=1,
+        description="Firestore clients (each with its own gRPC channel) to rotate",
+    )
 
     # Firebase Emulator Settings
     USE_FIREBASE_EMULATOR: bool = Field(
@@ -99,6 +110,41 @@ class Settings(BaseSettings):
         default=7, description="Refresh token expiration time in days"
     )
 
+    # Auth Cache Settings
+    TOKEN_CACHE_TTL: int = Field(
+        default=30, description="Verified ID token cache TTL in seconds"
+    )
+    TOKEN_CACHE_MAX_SIZE: int = Field(
+        default=10000, description="Maximum number of cached verified ID tokens"
+    )
+    USER_CACHE_TTL: int = Field(
+        default=60, description="Authenticated user profile cache TTL in seconds"
+    )
+    USER_CACHE_MAX_SIZE: int = Field(
+        default=5000, description="Maximum number of cached user profiles"
+    )
+    AUTH_EXECUTOR_WORKERS: int = Field(
+        default=8, ge=2, description="Threads reserved for Firebase Auth admin calls"
+    )
+    LAST_LOGIN_UPDATE_INTERVAL: int = Field(
+        default=60,
+        description="Minimum seconds between last_login_at writes per user",
+    )
+
+    # Cache Settings
+    ITEM_STATS_CACHE_TTL: int = Field(
+        default=60, description="Seconds to cache the item statistics response"
+    )
+    USER_STATS_CACHE_TTL: int = Field(
+        default=60, description="Seconds to cache the user statistics response"
+    )
+    ITEM_CACHE_TTL: int = Field(
+        default=30, description="Seconds to cache item documents for get_item"
+    )
+    ITEM_CACHE_MAX_SIZE: int = Field(
+        default=1000, description="Maximum number of cached item documents"
+    )
+
     # Rate Limiting
     RATE_LIMIT_REQUESTS: int = Field(
         default=100, description="Number of requests allowed per minute"
@@ -106,10 +152,23 @@ class Settings(BaseSettings):
     RATE_LIMIT_WINDOW: int = Field(
         default=60, description="Rate limit window in seconds"
     )
+    TRUSTED_PROXY_HOPS: int = Field(
+        default=0,
+        description=(
+            "Proxies in front of the app that append to X-Forwarded-For; "
+            "0 ignores the header. Cloud Run's front end is one"
+        ),
+    )
 
     # Logging Settings
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
     LOG_FORMAT: str = Field(default="json", description="Log format: json or console")
+    LOG_QUEUE_MAX_SIZE: int = Field(
+        default=10000, description="Max queued log events before oldest are dropped"
+    )
+    LOG_REQUEST_HEADERS: bool = Field(
+        default=False, description="Log all request headers instead of a few"
+    )
 
     # Health Check Settings
     HEALTH_CHECK_INTERVAL: int = Field(
@@ -128,28 +187,23 @@ class Settings(BaseSettings):
     def is_testing(self) -> bool:
         return self.ENVIRONMENT.lower() == "test"
 
-    @property
+    @cached_property
     def firebase_emulator_config(self) -> Dict[str, Any]:
         """Get Firebase emulator configuration."""
         config = {}
 
         if self.FIREBASE_AUTH_EMULATOR_HOST:
-            os.environ["FIREBASE_AUTH_EMULATOR_HOST"] = self.FIREBASE_AUTH_EMULATOR_HOST
             config["auth_emulator_host"] = self.FIREBASE_AUTH_EMULATOR_HOST
 
         if self.FIRESTORE_EMULATOR_HOST:
-            os.environ["FIRESTORE_EMULATOR_HOST"] = self.FIRESTORE_EMULATOR_HOST
             config["firestore_emulator_host"] = self.FIRESTORE_EMULATOR_HOST
 
         if self.FIREBASE_STORAGE_EMULATOR_HOST:
-            os.environ["FIREBASE_STORAGE_EMULATOR_HOST"] = (
-                self.FIREBASE_STORAGE_EMULATOR_HOST
-            )
             config["storage_emulator_host"] = self.FIREBASE_STORAGE_EMULATOR_HOST
 
         return config
 
-    @property
+    @cached_property
     def should_use_emulator(self) -> bool:
         """Determine if we should use Firebase emulator based on environment."""
         # Auto-detect emulator usage if not explicitly set
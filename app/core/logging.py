@@ -1,56 +1,89 @@
 import logging
+import os
 import sys
-from typing import Any, Dict
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
+import orjson
 import structlog
 from rich.console import Console
 from rich.logging import RichHandler
 
 from app.core.config import settings
+from app.core.logging_async import _stamp_time, enqueue_log_event
+
+
+class _NamedBytesLogger(structlog.BytesLogger):
+    """BytesLogger that keeps the name it was requested with."""
+
+    def __init__(self, name: Optional[str] = None):
+        super().__init__()
+        self.name = name
+
+
+def _add_timestamp(logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Any:
+    """Stamp the current time unless the event was queued with its own."""
+    if "timestamp" in event_dict:
+        return event_dict
+    return _stamp_time(logger, method_name, event_dict)
+
+
+# Processors are built once at import; setup_logging only picks a chain.
+# Log calls pass keyword fields and str events, so no positional argument
+# formatting or bytes decoding is needed.
+_JSON_PROCESSORS = (
+    structlog.stdlib.add_logger_name,
+    structlog.processors.add_log_level,
+    _add_timestamp,
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+    structlog.processors.JSONRenderer(serializer=orjson.dumps),
+)
+
+_CONSOLE_PROCESSORS = (
+    # Drop disabled levels before any other processor runs
+    structlog.stdlib.filter_by_level,
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    _add_timestamp,
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+    structlog.dev.ConsoleRenderer(colors=True),
+)
 
 
 def setup_logging() -> None:
     """Set up structured logging with different outputs for different environments."""
 
-    # Configure structlog
-    timestamper = structlog.processors.TimeStamper(fmt="ISO")
-
-    shared_processors = [
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        timestamper,
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-    ]
+    # Unknown level names fall back to INFO instead of failing at startup
+    log_level = logging.getLevelNamesMapping().get(
+        settings.LOG_LEVEL.upper(), logging.INFO
+    )
 
     if settings.LOG_FORMAT == "json" or settings.is_production:
-        # JSON logging for production
+        # JSON logging for production: render with orjson and write bytes
+        # straight to stdout, bypassing the stdlib logging machinery. Level
+        # filtering happens in the bound logger.
         structlog.configure(
-            processors=shared_processors
-            + [
-                structlog.processors.dict_tracebacks,
-                structlog.processors.JSONRenderer(),
-            ],
-            wrapper_class=structlog.stdlib.BoundLogger,
-            logger_factory=structlog.stdlib.LoggerFactory(),
+            processors=_JSON_PROCESSORS,
+            wrapper_class=structlog.make_filtering_bound_logger(log_level),
+            logger_factory=_NamedBytesLogger,
             cache_logger_on_first_use=True,
         )
 
-        # Configure standard library logging for JSON
+        # Standard library logging for third-party loggers (uvicorn, httpx)
         logging.basicConfig(
             format="%(message)s",
             stream=sys.stdout,
-            level=getattr(logging, settings.LOG_LEVEL.upper()),
+            level=log_level,
         )
     else:
         # Rich/console logging for development
         console = Console(color_system="auto")
 
         structlog.configure(
-            processors=shared_processors + [structlog.dev.ConsoleRenderer(colors=True)],
+            processors=_CONSOLE_PROCESSORS,
             wrapper_class=structlog.stdlib.BoundLogger,
             logger_factory=structlog.stdlib.LoggerFactory(),
             cache_logger_on_first_use=True,
@@ -58,7 +91,7 @@ def setup_logging() -> None:
 
         # Configure standard library logging with Rich
         logging.basicConfig(
-            level=getattr(logging, settings.LOG_LEVEL.upper()),
+            level=log_level,
             format="%(message)s",
             datefmt="[%X]",
             handlers=[
@@ -76,69 +109,115 @@ def setup_logging() -> None:
     logging.getLogger("httpcore").setLevel(logging.WARNING)
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str = __name__) -> structlog.BoundLogger:
-    """Get a structured logger instance."""
+    """Get a structured logger instance.
+
+    Loggers are cached per name so each one is only bound on first use.
+    """
     return structlog.get_logger(name)
 
 
+# Request headers logged unless LOG_REQUEST_HEADERS is set
+LOGGED_HEADERS = ("user-agent", "content-type")
+
+# Probe endpoints hit every few seconds per instance; not worth logging
+UNLOGGED_PATHS = frozenset({"/health", "/ready"})
+
+
 class LoggingMiddleware:
-    """Middleware for logging requests and responses."""
+    """Middleware for logging requests and responses.
+
+    Also assigns the request ID and adds the X-Request-ID and X-Process-Time
+    response headers, so a single middleware wraps each request. Events go
+    through the background log writer, so stdout writes stay off the
+    request path.
+    """
 
     def __init__(self, logger_name: str = "app.middleware.logging"):
-        self.logger = get_logger(logger_name)
+        self.logger_name = logger_name
+
+    @staticmethod
+    def _add_response_headers(response, request_id: str, start_ns: int) -> int:
+        """Add the request ID and timing headers; return the duration in ns."""
+        duration_ns = time.perf_counter_ns() - start_ns
+        response.headers["X-Process-Time"] = f"{duration_ns / 1e9:.6f}"
+        response.headers["X-Request-ID"] = request_id
+        return duration_ns
 
     async def __call__(self, request, call_next):
         """Log request and response details."""
-        import time
-        from uuid import uuid4
+        # Generate request ID (32 random hex chars; no UUID object needed)
+        request_id = os.urandom(16).hex()
+        request.state.request_id = request_id
+        start_ns = time.perf_counter_ns()
+
+        # Probes still get the request ID and timing headers, just no log events
+        if request.url.path in UNLOGGED_PATHS:
+            response = await call_next(request)
+            self._add_response_headers(response, request_id, start_ns)
+            return response
 
-        # Generate request ID
-        request_id = str(uuid4())
+        # Log request; duration_ms is truncated to 10us steps with integer math
+        url = str(request.url)
 
-        # Log request
-        start_time = time.perf_counter()
+        if settings.LOG_REQUEST_HEADERS:
+            headers = dict(request.headers)
+        else:
+            headers = {name: request.headers.get(name) for name in LOGGED_HEADERS}
 
-        self.logger.info(
+        enqueue_log_event(
+            self.logger_name,
+            "info",
             "Request started",
-            request_id=request_id,
-            method=request.method,
-            url=str(request.url),
-            headers=dict(request.headers),
-            client_ip=request.client.host if request.client else None,
+            {
+                "request_id": request_id,
+                "method": request.method,
+                "url": url,
+                "headers": headers,
+                "client_ip": request.client.host if request.client else None,
+            },
         )
 
         try:
             # Process request
             response = await call_next(request)
 
-            # Calculate duration
-            duration = time.perf_counter() - start_time
+            duration_ns = self._add_response_headers(response, request_id, start_ns)
 
             # Log response
-            self.logger.info(
+            enqueue_log_event(
+                self.logger_name,
+                "info",
                 "Request completed",
-                request_id=request_id,
-                method=request.method,
-                url=str(request.url),
-                status_code=response.status_code,
-                duration_ms=round(duration * 1000, 2),
+                {
+                    "request_id": request_id,
+                    "method": request.method,
+                    "url": url,
+                    "status_code": response.status_code,
+                    "duration_ms": duration_ns // 10_000 / 100,
+                },
             )
 
             return response
 
         except Exception as exc:
             # Calculate duration for failed requests
-            duration = time.perf_counter() - start_time
+            duration_ns = time.perf_counter_ns() - start_ns
 
-            # Log error
-            self.logger.error(
+            # Log error; the global exception handler logs the traceback
+            enqueue_log_event(
+                self.logger_name,
+                "error",
                 "Request failed",
-                request_id=request_id,
-                method=request.method,
-                url=str(request.url),
-                duration_ms=round(duration * 1000, 2),
-                error=str(exc),
-                exc_info=exc,
+                {
+                    "request_id": request_id,
+                    "method": request.method,
+                    "url": url,
+                    "duration_ms": duration_ns // 10_000 / 100,
+                    "error": str(exc),
+                    "error_type": type(exc).__name__,
+                },
             )
 
             raise
@@ -154,14 +233,22 @@ def log_api_call(
     endpoint: str, method: str, user_id: str = None, **kwargs: Any
 ) -> None:
     """Log API calls with context."""
-    logger = get_logger("app.api")
-    logger.info("API call", endpoint=endpoint, method=method, user_id=user_id, **kwargs)
+    enqueue_log_event(
+        "app.api",
+        "info",
+        "API call",
+        {"endpoint": endpoint, "method": method, "user_id": user_id, **kwargs},
+    )
 
 
 def log_security_event(event_type: str, user_id: str = None, **kwargs: Any) -> None:
     """Log security-related events."""
-    logger = get_logger("app.security")
-    logger.warning("Security event", event_type=event_type, user_id=user_id, **kwargs)
+    enqueue_log_event(
+        "app.security",
+        "warning",
+        "Security event",
+        {"event_type": event_type, "user_id": user_id, **kwargs},
+    )
 
 
 def log_error(error: Exception, context: Dict[str, Any] = None) -> None:
@@ -0,0 +1,158 @@
+import asyncio
+import sys
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import structlog
+
+from app.core.config import settings
+
+# (logger name, level, event, fields)
+LogEvent = Tuple[str, str, str, Dict[str, Any]]
+
+# Max events handed to the writer thread in one go
+MAX_BATCH_SIZE = 256
+
+# Same stamp the logging processors add to events logged inline
+_stamp_time = structlog.processors.TimeStamper(fmt="ISO")
+
+# Queued by stop() after the last event; the writer exits once it reaches it
+_STOP = object()
+
+
+@lru_cache(maxsize=None)
+def _get_logger(logger_name: str) -> Any:
+    """Get the structlog logger for a name, cached so it is bound once."""
+    return structlog.get_logger(logger_name)
+
+
+def _emit(log_event: LogEvent) -> None:
+    """Emit a single log event through structlog."""
+    logger_name, level, event, fields = log_event
+    getattr(_get_logger(logger_name), level)(event, **fields)
+
+
+def _emit_batch(batch: List[LogEvent]) -> None:
+    """Emit a batch of log events.
+
+    An event that fails to render or write is reported on stderr instead of
+    taking the rest of the batch, and the writer, down with it.
+    """
+    for log_event in batch:
+        try:
+            _emit(log_event)
+        except Exception as e:
+            sys.stderr.write(
+                f"Failed to write log event {log_event[2]!r}: "
+                f"{type(e).__name__}: {e}\n"
+            )
+
+
+class _LogWriter:
+    """Queue of log events written in batches off one event loop."""
+
+    def __init__(self) -> None:
+        self.queue: Optional[asyncio.Queue] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.task: Optional[asyncio.Task] = None
+        self.dropped = 0
+
+    def enqueue(self, log_event: LogEvent) -> bool:
+        """Queue an event if called on the writer's loop; return whether it was."""
+        queue = self.queue
+        # Log inline rather than into a queue nothing is draining
+        if queue is None or self.task is None or self.task.done():
+            return False
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        if running_loop is not self.loop:
+            return False
+
+        if queue.full():
+            queue.get_nowait()
+            self.dropped += 1
+        queue.put_nowait(log_event)
+        return True
+
+    async def _drain(self, queue: asyncio.Queue) -> None:
+        """Write queued log events in batches until the stop marker."""
+        stopping = False
+        while not stopping:
+            batch = []
+            item = await queue.get()
+            while True:
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+                if len(batch) >= MAX_BATCH_SIZE or queue.empty():
+                    break
+                item = queue.get_nowait()
+
+            if self.dropped:
+                batch.append(
+                    (
+                        "app.logging",
+                        "warning",
+                        "Dropped queued log events",
+                        {"dropped": self.dropped},
+                    )
+                )
+                self.dropped = 0
+
+            if batch:
+                await asyncio.to_thread(_emit_batch, batch)
+
+    def start(self) -> None:
+        """Start writing on the running event loop."""
+        if self.task is not None:
+            return
+
+        self.queue = asyncio.Queue(maxsize=settings.LOG_QUEUE_MAX_SIZE)
+        self.loop = asyncio.get_running_loop()
+        self.task = self.loop.create_task(self._drain(self.queue))
+
+    async def stop(self) -> None:
+        """Stop writing once every event queued so far has been written."""
+        if self.task is None:
+            return
+
+        queue, task = self.queue, self.task
+        # Later events are logged inline while the backlog is written
+        self.queue = None
+        self.loop = None
+        self.task = None
+
+        if not task.done():
+            await queue.put(_STOP)
+            await task
+
+
+_writer = _LogWriter()
+
+
+def enqueue_log_event(
+    logger_name: str, level: str, event: str, fields: Dict[str, Any]
+) -> None:
+    """Queue a log event for the background writer.
+
+    Queued events are stamped with the time they were logged. Falls back to
+    logging inline when the writer is not running or when called from outside
+    the writer's event loop.
+    """
+    queued_fields = _stamp_time(None, level, {**fields})
+    if not _writer.enqueue((logger_name, level, event, queued_fields)):
+        _emit((logger_name, level, event, fields))
+
+
+def start_log_writer() -> None:
+    """Start the background log writer on the running event loop."""
+    _writer.start()
+
+
+async def stop_log_writer() -> None:
+    """Stop the background log writer and flush pending events."""
+    await _writer.stop()
@@ -0,0 +1,20 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """JSON response rendered by pydantic-core.
+
+    Datetimes come out in the same format as response_model serialization,
+    and Firestore timestamps (datetime subclasses) are handled natively.
+    Returning one from an endpoint bypasses FastAPI's response_model
+    validation and serialization, so the content must already match the
+    route's declared response model.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
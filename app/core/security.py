@@ -1,9 +1,17 @@
+import asyncio
+import base64
+import hashlib
+import json
+import secrets
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
+import firebase_admin
+import jwt
+from cachetools import TTLCache
 from firebase_admin import auth as firebase_auth
 from fastapi import HTTPException, status
-from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
@@ -12,6 +20,17 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 ALGORITHM = "HS256"
 
+# Tokens this close to expiry are always re-verified instead of served from cache
+TOKEN_EXPIRY_LEEWAY_SECONDS = 5
+
+# Per-process key for token cache hashes, so cache keys cannot be precomputed
+_TOKEN_CACHE_HASH_KEY = secrets.token_bytes(32)
+
+# Verified Firebase ID tokens keyed by a hash of the raw token
+_id_token_cache: TTLCache = TTLCache(
+    maxsize=settings.TOKEN_CACHE_MAX_SIZE, ttl=settings.TOKEN_CACHE_TTL
+)
+
 
 def create_access_token(
     subject: str,
@@ -49,7 +68,7 @@ def verify_token(token: str) -> Dict[str, Any]:
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
         return payload
-    except JWTError:
+    except jwt.PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
@@ -67,10 +86,85 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def _id_token_cache_key(token: str) -> bytes:
+    """Build the ID token cache key for a raw token."""
+    return hashlib.blake2b(
+        token.encode(), digest_size=16, key=_TOKEN_CACHE_HASH_KEY
+    ).digest()
+
+
+def get_cached_id_token(token: str) -> Optional[Dict[str, Any]]:
+    """Get a previously verified ID token if it is not about to expire."""
+    decoded_token = _id_token_cache.get(_id_token_cache_key(token))
+    if (
+        decoded_token is not None
+        and decoded_token["exp"] > time.time() + TOKEN_EXPIRY_LEEWAY_SECONDS
+    ):
+        return decoded_token
+    return None
+
+
+async def verify_id_token_cached(
+    token: str, app: Optional[firebase_admin.App] = None
+) -> Dict[str, Any]:
+    """Verify Firebase ID token, reusing recent verification results.
+
+    The cache is only touched on the event loop; TTLCache is not thread-safe.
+    """
+    decoded_token = get_cached_id_token(token)
+    if decoded_token is not None:
+        return decoded_token
+
+    key = _id_token_cache_key(token)
+    try:
+        # Signature checks (and key refreshes) block, so keep them off the loop
+        decoded_token = await asyncio.to_thread(
+            firebase_auth.verify_id_token, token, app=app
+        )
+    except firebase_auth.InvalidIdTokenError:
+        # Covers expired and revoked tokens as well
+        _id_token_cache.pop(key, None)
+        raise
+
+    _id_token_cache[key] = decoded_token
+    return decoded_token
+
+
+def is_well_formed_id_token(token: str) -> bool:
+    """Cheaply check that a token looks like a Firebase ID token.
+
+    Rejects obvious garbage before any signature verification or public key
+    fetch. Tokens that pass still need full verification.
+    """
+    parts = token.split(".")
+    if len(parts) != 3 or not parts[0] or not parts[1]:
+        return False
+
+    try:
+        header = json.loads(
+            base64.urlsafe_b64decode(parts[0] + "=" * (-len(parts[0]) % 4))
+        )
+    except ValueError:
+        return False
+
+    if not isinstance(header, dict):
+        return False
+
+    # Auth emulator tokens are unsigned
+    if settings.should_use_emulator:
+        return True
+
+    return header.get("alg") == "RS256" and "kid" in header
+
+
 async def verify_firebase_token(token: str) -> Dict[str, Any]:
     """Verify Firebase ID token and return decoded token."""
     try:
-        decoded_token = firebase_auth.verify_id_token(token)
+        decoded_token = get_cached_id_token(token)
+        if decoded_token is None:
+            if not is_well_formed_id_token(token):
+                raise firebase_auth.InvalidIdTokenError("Malformed ID token")
+            decoded_token = await verify_id_token_cached(token)
         return decoded_token
     except Exception as e:
         raise HTTPException(
@@ -2,9 +2,12 @@ import asyncio
 import time
 from contextlib import asynccontextmanager
 from typing import Any, Dict
+from urllib.parse import urlsplit
 
 import structlog
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
@@ -14,7 +17,10 @@ from app.api.v1.items import router as items_router
 from app.api.v1.users import router as users_router
 from app.core.config import settings
 from app.core.logging import LoggingMiddleware, get_logger, setup_logging
+from app.core.logging_async import start_log_writer, stop_log_writer
+from app.core.responses import PydanticJSONResponse
 from app.services.firebase import get_firebase_health, initialize_firebase
+from app.services.firestore import get_firestore_service
 
 # Setup logging
 setup_logging()
@@ -25,6 +31,7 @@ logger = get_logger(__name__)
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
+    start_log_writer()
     logger.info(
         "Starting FastAPI application",
         app_name=settings.APP_NAME,
@@ -36,6 +43,12 @@ async def lifespan(app: FastAPI):
         initialize_firebase()
         logger.info("Firebase initialized successfully")
 
+        # Build the Firestore client pool up front instead of on first use
+        try:
+            get_firestore_service().initialize()
+        except Exception as e:
+            logger.warning("Firestore client pool not created", error=str(e))
+
         # Add any other startup tasks here
 
         yield
@@ -46,6 +59,7 @@ async def lifespan(app: FastAPI):
     finally:
         # Shutdown
         logger.info("Shutting down FastAPI application")
+        await stop_log_writer()
 
 
 # Create FastAPI application
@@ -72,10 +86,14 @@ if settings.BACKEND_CORS_ORIGINS:
 
 # Add trusted host middleware for production
 if settings.is_production:
+    # The middleware matches bare host names, while CORS origins are URLs
+    cors_hosts = [
+        urlsplit(str(origin)).hostname or str(origin)
+        for origin in settings.BACKEND_CORS_ORIGINS
+    ]
     app.add_middleware(
         TrustedHostMiddleware,
-        allowed_hosts=["*.googleusercontent.com", "*.run.app"]
-        + settings.BACKEND_CORS_ORIGINS,
+        allowed_hosts=["*.googleusercontent.com", "*.run.app", *cors_hosts],
     )
 
 # Add logging middleware
@@ -83,43 +101,6 @@ logging_middleware = LoggingMiddleware()
 app.middleware("http")(logging_middleware)
 
 
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    """Add process time header to responses."""
-    start_time = time.perf_counter()
-    response = await call_next(request)
-    process_time = time.perf_counter() - start_time
-    response.headers["X-Process-Time"] = f"{process_time:.6f}"
-    return response
-
-
-@app.middleware("http")
-async def add_request_id_header(request: Request, call_next):
-    """Add request ID header to responses."""
-    from uuid import uuid4
-
-    request_id = str(uuid4())
-    request.state.request_id = request_id
-
-    response = await call_next(request)
-    response.headers["X-Request-ID"] = request_id
-    return response
-
-
-@app.middleware("http")
-async def rate_limiting_middleware(request: Request, call_next):
-    """Basic rate limiting middleware."""
-    # In production, you would implement proper rate limiting
-    # using Redis or another storage backend
-
-    # For now, just log the request
-    client_ip = request.client.host if request.client else "unknown"
-    logger.debug("Request from client", client_ip=client_ip, path=request.url.path)
-
-    response = await call_next(request)
-    return response
-
-
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler."""
@@ -133,7 +114,7 @@ async def global_exception_handler(request: Request, exc: Exception):
 
     if settings.DEBUG:
         # In debug mode, return detailed error information
-        return JSONResponse(
+        return PydanticJSONResponse(
             status_code=500,
             content={
                 "error": "Internal Server Error",
@@ -143,7 +124,7 @@ async def global_exception_handler(request: Request, exc: Exception):
         )
     else:
         # In production, return generic error message
-        return JSONResponse(
+        return PydanticJSONResponse(
             status_code=500,
             content={
                 "error": "Internal Server Error",
@@ -235,9 +216,6 @@ if not settings.is_production:
 
 
 # Error handling for specific HTTP exceptions
-from fastapi import HTTPException
-
-
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions."""
@@ -249,7 +227,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
         detail=exc.detail,
     )
 
-    return JSONResponse(
+    return PydanticJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.detail,
@@ -259,24 +237,24 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 
 
 # Validation error handler
-from fastapi.exceptions import RequestValidationError
-
-
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors."""
+    # Error contexts can hold exception objects, which are not JSON serializable
+    errors = jsonable_encoder(exc.errors())
+
     logger.warning(
         "Validation error",
         path=request.url.path,
         method=request.method,
-        errors=exc.errors(),
+        errors=errors,
     )
 
-    return JSONResponse(
+    return PydanticJSONResponse(
         status_code=422,
         content={
             "error": "Validation Error",
-            "detail": exc.errors(),
+            "detail": errors,
         },
     )
 
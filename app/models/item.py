@@ -1,8 +1,50 @@
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    field_validator,
+)
+
+from app.utils.helpers import coerce_timestamps
+
+# Extra tags beyond this are dropped
+MAX_ITEM_TAGS = 10
+
+# Fields stored as Firestore timestamps
+ITEM_TIMESTAMP_FIELDS = ("created_at", "updated_at")
+
+
+def _dedupe_tags(tags: List[str]) -> List[str]:
+    """Drop empty and repeated tags, keeping the first MAX_ITEM_TAGS."""
+    return list(dict.fromkeys(tag for tag in tags if tag))[:MAX_ITEM_TAGS]
+
+
+def _blank_to_none(value: str) -> Optional[str]:
+    """Treat a blank (already stripped) string as missing."""
+    return value or None
+
+
+# Titles and descriptions are trimmed by pydantic-core before length checks
+ItemTitle = Annotated[
+    str, StringConstraints(strip_whitespace=True, min_length=1, max_length=200)
+]
+ItemDescription = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, max_length=2000),
+    AfterValidator(_blank_to_none),
+]
+
+# Tags are trimmed and lowercased by pydantic-core, then deduplicated
+TagList = Annotated[
+    List[Annotated[str, StringConstraints(strip_whitespace=True, to_lower=True)]],
+    AfterValidator(_dedupe_tags),
+]
 
 
 class ItemStatus(str, Enum):
@@ -36,10 +78,8 @@ class ItemPriority(str, Enum):
 class ItemBase(BaseModel):
     """Base item model with common fields."""
 
-    title: str = Field(..., min_length=1, max_length=200, description="Item title")
-    description: Optional[str] = Field(
-        None, max_length=2000, description="Item description"
-    )
+    title: ItemTitle = Field(..., description="Item title")
+    description: Optional[ItemDescription] = Field(None, description="Item description")
     category: ItemCategory = Field(
         default=ItemCategory.GENERAL, description="Item category"
     )
@@ -47,40 +87,12 @@ class ItemBase(BaseModel):
         default=ItemPriority.MEDIUM, description="Item priority"
     )
     status: ItemStatus = Field(default=ItemStatus.DRAFT, description="Item status")
-    tags: List[str] = Field(default_factory=list, description="Item tags")
+    tags: TagList = Field(default_factory=list, description="Item tags")
     metadata: Dict[str, Any] = Field(
         default_factory=dict, description="Additional metadata"
     )
     is_public: bool = Field(default=False, description="Whether the item is public")
 
-    @field_validator("title")
-    @classmethod
-    def validate_title(cls, v: str) -> str:
-        v = v.strip()
-        if len(v) < 1:
-            raise ValueError("Title cannot be empty")
-        return v
-
-    @field_validator("description")
-    @classmethod
-    def validate_description(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None:
-            v = v.strip()
-            if len(v) == 0:
-                return None
-        return v
-
-    @field_validator("tags")
-    @classmethod
-    def validate_tags(cls, v: List[str]) -> List[str]:
-        # Clean and deduplicate tags
-        cleaned_tags = []
-        for tag in v:
-            cleaned_tag = tag.strip().lower()
-            if cleaned_tag and cleaned_tag not in cleaned_tags:
-                cleaned_tags.append(cleaned_tag)
-        return cleaned_tags[:10]  # Limit to 10 tags
-
 
 class ItemCreate(ItemBase):
     """Item creation model."""
@@ -91,49 +103,15 @@ class ItemCreate(ItemBase):
 class ItemUpdate(BaseModel):
     """Item update model."""
 
-    title: Optional[str] = Field(
-        None, min_length=1, max_length=200, description="Item title"
-    )
-    description: Optional[str] = Field(
-        None, max_length=2000, description="Item description"
-    )
+    title: Optional[ItemTitle] = Field(None, description="Item title")
+    description: Optional[ItemDescription] = Field(None, description="Item description")
     category: Optional[ItemCategory] = Field(None, description="Item category")
     priority: Optional[ItemPriority] = Field(None, description="Item priority")
     status: Optional[ItemStatus] = Field(None, description="Item status")
-    tags: Optional[List[str]] = Field(None, description="Item tags")
+    tags: Optional[TagList] = Field(None, description="Item tags")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
     is_public: Optional[bool] = Field(None, description="Whether the item is public")
 
-    @field_validator("title")
-    @classmethod
-    def validate_title(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None:
-            v = v.strip()
-            if len(v) < 1:
-                raise ValueError("Title cannot be empty")
-        return v
-
-    @field_validator("description")
-    @classmethod
-    def validate_description(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None:
-            v = v.strip()
-            if len(v) == 0:
-                return None
-        return v
-
-    @field_validator("tags")
-    @classmethod
-    def validate_tags(cls, v: Optional[List[str]]) -> Optional[List[str]]:
-        if v is not None:
-            cleaned_tags = []
-            for tag in v:
-                cleaned_tag = tag.strip().lower()
-                if cleaned_tag and cleaned_tag not in cleaned_tags:
-                    cleaned_tags.append(cleaned_tag)
-            return cleaned_tags[:10]  # Limit to 10 tags
-        return v
-
 
 class Item(ItemBase):
     """Full item model with all fields."""
@@ -146,9 +124,7 @@ class Item(ItemBase):
     like_count: int = Field(default=0, description="Number of likes")
     share_count: int = Field(default=0, description="Number of shares")
 
-    class Config:
-        from_attributes = True
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ItemInDB(Item):
@@ -158,14 +134,7 @@ class ItemInDB(Item):
     def from_firestore_doc(cls, doc_data: Dict[str, Any]) -> "ItemInDB":
         """Create ItemInDB from Firestore document data."""
         # Handle Firebase Timestamps
-        if "created_at" in doc_data and hasattr(doc_data["created_at"], "timestamp"):
-            doc_data["created_at"] = datetime.fromtimestamp(
-                doc_data["created_at"].timestamp()
-            )
-        if "updated_at" in doc_data and hasattr(doc_data["updated_at"], "timestamp"):
-            doc_data["updated_at"] = datetime.fromtimestamp(
-                doc_data["updated_at"].timestamp()
-            )
+        coerce_timestamps(doc_data, ITEM_TIMESTAMP_FIELDS)
 
         # Ensure required fields have defaults
         doc_data.setdefault("tags", [])
@@ -174,7 +143,7 @@ class ItemInDB(Item):
         doc_data.setdefault("like_count", 0)
         doc_data.setdefault("share_count", 0)
 
-        return cls(**doc_data)
+        return cls.model_validate(doc_data)
 
 
 class ItemPublic(BaseModel):
@@ -192,9 +161,7 @@ class ItemPublic(BaseModel):
     view_count: int = Field(default=0, description="Number of views")
     like_count: int = Field(default=0, description="Number of likes")
 
-    class Config:
-        from_attributes = True
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ItemSummary(BaseModel):
@@ -209,9 +176,7 @@ class ItemSummary(BaseModel):
     view_count: int = Field(default=0, description="Number of views")
     like_count: int = Field(default=0, description="Number of likes")
 
-    class Config:
-        from_attributes = True
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ItemList(BaseModel):
@@ -307,6 +272,3 @@ class ItemInteraction(BaseModel):
     metadata: Dict[str, Any] = Field(
         default_factory=dict, description="Additional interaction data"
     )
-
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
@@ -1,7 +1,64 @@
+import string
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-from pydantic import BaseModel, Field, EmailStr, field_validator
+from functools import cached_property
+from typing import Annotated, Any, Dict, FrozenSet, List, Optional
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    EmailStr,
+    StringConstraints,
+    field_validator,
+)
+
+from app.utils.helpers import coerce_timestamps
+
+# Fields stored as Firestore timestamps
+USER_TIMESTAMP_FIELDS = ("created_at", "updated_at", "last_login_at")
+
+# Display names are trimmed by pydantic-core before length checks
+DisplayName = Annotated[
+    str, StringConstraints(strip_whitespace=True, min_length=2, max_length=100)
+]
+
+# Separators stripped from phone numbers in a single str.translate pass
+_PHONE_SEPARATORS = str.maketrans("", "", " -()")
+
+
+def _clean_phone_number(v: Optional[str]) -> Optional[str]:
+    """Strip separators from a phone number and check its basic shape."""
+    if v is not None:
+        v = v.translate(_PHONE_SEPARATORS)
+        if not v.startswith("+"):
+            raise ValueError("Phone number must include country code (start with +)")
+        if len(v) < 10:
+            raise ValueError("Phone number is too short")
+    return v
+
+
+_ASCII_UPPER = frozenset(string.ascii_uppercase)
+_ASCII_LOWER = frozenset(string.ascii_lowercase)
+_ASCII_DIGITS = frozenset(string.digits)
+
+
+def _check_password_strength(v: Optional[str]) -> Optional[str]:
+    """Require 8+ characters with an uppercase letter, a lowercase letter and a digit.
+
+    Checks the distinct characters against ASCII sets first and only scans
+    them with the Unicode predicates when that finds nothing.
+    """
+    if v is not None:
+        if len(v) < 8:
+            raise ValueError("Password must be at least 8 characters long")
+        chars = set(v)
+        if not (chars & _ASCII_UPPER or any(c.isupper() for c in chars)):
+            raise ValueError("Password must contain at least one uppercase letter")
+        if not (chars & _ASCII_LOWER or any(c.islower() for c in chars)):
+            raise ValueError("Password must contain at least one lowercase letter")
+        if not (chars & _ASCII_DIGITS or any(c.isdigit() for c in chars)):
+            raise ValueError("Password must contain at least one digit")
+    return v
 
 
 class UserRole(BaseModel):
@@ -52,36 +109,16 @@ class UserBase(BaseModel):
     """Base user model with common fields."""
 
     email: EmailStr = Field(..., description="User email address")
-    display_name: Optional[str] = Field(
-        None, max_length=100, description="Display name"
-    )
+    display_name: Optional[DisplayName] = Field(None, description="Display name")
     phone_number: Optional[str] = Field(
         None, description="Phone number with country code"
     )
     photo_url: Optional[str] = Field(None, description="Profile photo URL")
 
-    @field_validator("display_name")
-    @classmethod
-    def validate_display_name(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None:
-            v = v.strip()
-            if len(v) < 2:
-                raise ValueError("Display name must be at least 2 characters long")
-        return v
-
     @field_validator("phone_number")
     @classmethod
     def validate_phone_number(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None:
-            # Basic phone number validation
-            v = v.replace(" ", "").replace("-", "").replace("(", "").replace(")", "")
-            if not v.startswith("+"):
-                raise ValueError(
-                    "Phone number must include country code (start with +)"
-                )
-            if len(v) < 10:
-                raise ValueError("Phone number is too short")
-        return v
+        return _clean_phone_number(v)
 
 
 class UserCreate(UserBase):
@@ -104,25 +141,14 @@ class UserCreate(UserBase):
     @field_validator("password")
     @classmethod
     def validate_password(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None:
-            if len(v) < 8:
-                raise ValueError("Password must be at least 8 characters long")
-            if not any(c.isupper() for c in v):
-                raise ValueError("Password must contain at least one uppercase letter")
-            if not any(c.islower() for c in v):
-                raise ValueError("Password must contain at least one lowercase letter")
-            if not any(c.isdigit() for c in v):
-                raise ValueError("Password must contain at least one digit")
-        return v
+        return _check_password_strength(v)
 
 
 class UserUpdate(BaseModel):
     """User update model."""
 
     email: Optional[EmailStr] = Field(None, description="User email address")
-    display_name: Optional[str] = Field(
-        None, max_length=100, description="Display name"
-    )
+    display_name: Optional[DisplayName] = Field(None, description="Display name")
     phone_number: Optional[str] = Field(
         None, description="Phone number with country code"
     )
@@ -139,41 +165,15 @@ class UserUpdate(BaseModel):
     profile: Optional[UserProfile] = Field(None, description="User profile")
     preferences: Optional[UserPreferences] = Field(None, description="User preferences")
 
-    @field_validator("display_name")
-    @classmethod
-    def validate_display_name(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None:
-            v = v.strip()
-            if len(v) < 2:
-                raise ValueError("Display name must be at least 2 characters long")
-        return v
-
     @field_validator("phone_number")
     @classmethod
     def validate_phone_number(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None:
-            v = v.replace(" ", "").replace("-", "").replace("(", "").replace(")", "")
-            if not v.startswith("+"):
-                raise ValueError(
-                    "Phone number must include country code (start with +)"
-                )
-            if len(v) < 10:
-                raise ValueError("Phone number is too short")
-        return v
+        return _clean_phone_number(v)
 
     @field_validator("password")
     @classmethod
     def validate_password(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None:
-            if len(v) < 8:
-                raise ValueError("Password must be at least 8 characters long")
-            if not any(c.isupper() for c in v):
-                raise ValueError("Password must contain at least one uppercase letter")
-            if not any(c.islower() for c in v):
-                raise ValueError("Password must contain at least one lowercase letter")
-            if not any(c.isdigit() for c in v):
-                raise ValueError("Password must contain at least one digit")
-        return v
+        return _check_password_strength(v)
 
 
 class User(UserBase):
@@ -199,34 +199,34 @@ class User(UserBase):
     updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
     last_login_at: Optional[datetime] = Field(None, description="Last login timestamp")
 
-    class Config:
-        from_attributes = True
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserInDB(User):
-    """User model as stored in database (includes internal fields)."""
+    """User model as stored in database (includes internal fields).
+
+    Instances are cached and shared between requests, so they are frozen.
+    """
 
     id: str = Field(..., description="Document ID (same as uid)")
 
+    model_config = ConfigDict(frozen=True)
+
+    @cached_property
+    def roles_set(self) -> FrozenSet[str]:
+        """User roles as a frozenset for fast membership checks."""
+        return frozenset(self.roles)
+
+    @cached_property
+    def feature_flags(self) -> Dict[str, Any]:
+        """Feature flags from the user's custom claims."""
+        return (self.custom_claims or {}).get("feature_flags", {})
+
     @classmethod
     def from_firestore_doc(cls, doc_data: Dict[str, Any]) -> "UserInDB":
         """Create UserInDB from Firestore document data."""
         # Handle Firebase Timestamps
-        if "created_at" in doc_data and hasattr(doc_data["created_at"], "timestamp"):
-            doc_data["created_at"] = datetime.fromtimestamp(
-                doc_data["created_at"].timestamp()
-            )
-        if "updated_at" in doc_data and hasattr(doc_data["updated_at"], "timestamp"):
-            doc_data["updated_at"] = datetime.fromtimestamp(
-                doc_data["updated_at"].timestamp()
-            )
-        if "last_login_at" in doc_data and hasattr(
-            doc_data["last_login_at"], "timestamp"
-        ):
-            doc_data["last_login_at"] = datetime.fromtimestamp(
-                doc_data["last_login_at"].timestamp()
-            )
+        coerce_timestamps(doc_data, USER_TIMESTAMP_FIELDS)
 
         # Ensure required fields have defaults
         doc_data.setdefault("profile", {})
@@ -234,7 +234,7 @@ class UserInDB(User):
         doc_data.setdefault("roles", [])
         doc_data.setdefault("custom_claims", {})
 
-        return cls(**doc_data)
+        return cls.model_validate(doc_data)
 
 
 class UserPublic(BaseModel):
@@ -254,9 +254,7 @@ class UserPublic(BaseModel):
     company: Optional[str] = Field(None, description="User company")
     job_title: Optional[str] = Field(None, description="User job title")
 
-    class Config:
-        from_attributes = True
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserList(BaseModel):
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.item import ItemStatus, ItemCategory, ItemPriority
 
@@ -63,9 +63,7 @@ class ItemResponse(BaseModel):
     like_count: int = Field(default=0, description="Number of likes")
     share_count: int = Field(default=0, description="Number of shares")
 
-    class Config:
-        from_attributes = True
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ItemSummaryResponse(BaseModel):
@@ -84,19 +82,22 @@ class ItemSummaryResponse(BaseModel):
     view_count: int = Field(default=0, description="Number of views")
     like_count: int = Field(default=0, description="Number of likes")
 
-    class Config:
-        from_attributes = True
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ItemListResponse(BaseModel):
     """Item list response model."""
 
     items: List[ItemSummaryResponse] = Field(..., description="List of items")
-    total: int = Field(..., description="Total number of items")
+    total: Optional[int] = Field(
+        None, description="Total number of items (cursor pages: only if requested)"
+    )
     page: int = Field(default=1, description="Current page number")
     per_page: int = Field(default=20, description="Items per page")
     has_next: bool = Field(default=False, description="Whether there are more pages")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, if there is one"
+    )
 
 
 class ItemSearchRequest(BaseModel):
@@ -160,10 +161,11 @@ class BulkItemActionRequest(BaseModel):
         ..., description="Action: delete, archive, activate, make_public, make_private"
     )
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {"item_ids": ["item1", "item2", "item3"], "action": "archive"}
         }
+    )
 
 
 class ItemInteractionRequest(BaseModel):
@@ -268,6 +270,3 @@ class ItemVersionResponse(BaseModel):
     changes: Dict[str, Any] = Field(..., description="Changes made in this version")
     created_at: datetime = Field(..., description="Version creation timestamp")
     created_by: str = Field(..., description="User who created this version")
-
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
@@ -1,9 +1,10 @@
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 
 from app.models.user import (
+    User,
     UserProfile,
     UserPreferences,
 )
@@ -95,19 +96,46 @@ class UserResponse(BaseModel):
     updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
     last_login_at: Optional[datetime] = Field(None, description="Last login timestamp")
 
-    class Config:
-        from_attributes = True
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserResponse":
+        """Project an already validated User without validating it again."""
+        return cls.model_construct(
+            **{field: getattr(user, field) for field in USER_RESPONSE_FIELDS}
+        )
+
+
+# Every UserResponse field is also a User field
+USER_RESPONSE_FIELDS = tuple(UserResponse.model_fields)
+
+# Fields UserResponse requires that auth service user dicts may not carry yet
+USER_RESPONSE_DEFAULTS: Dict[str, Any] = {
+    "roles": [],
+    "profile": {},
+    "preferences": {},
+    "provider": "email",
+}
+
+
+def user_response_data(user: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill in missing UserResponse fields on an auth service user dict."""
+    return {**USER_RESPONSE_DEFAULTS, **user}
 
 
 class UserListResponse(BaseModel):
     """User list response model."""
 
     users: List[UserResponse] = Field(..., description="List of users")
-    total: int = Field(..., description="Total number of users")
+    total: Optional[int] = Field(
+        None, description="Not counted here; see the user stats endpoint"
+    )
     page: int = Field(default=1, description="Current page number")
     per_page: int = Field(default=50, description="Items per page")
     has_next: bool = Field(default=False, description="Whether there are more pages")
+    next_page_token: Optional[str] = Field(
+        None, description="Pass as page_token to fetch the next page"
+    )
 
 
 class UserCreateRequest(BaseModel):
@@ -217,14 +245,15 @@ class BulkUserActionRequest(BaseModel):
     """Bulk user action request model."""
 
     user_uids: List[str] = Field(..., min_items=1, description="List of user UIDs")
-    action: str = Field(
+    action: Literal["enable", "disable", "delete", "verify_email"] = Field(
         ..., description="Action to perform: enable, disable, delete, verify_email"
     )
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {"user_uids": ["uid1", "uid2", "uid3"], "action": "disable"}
         }
+    )
 
 
 class ProfileUpdateRequest(BaseModel):
@@ -260,9 +289,6 @@ class UserActivityResponse(BaseModel):
     recent_activity: List[Dict[str, Any]] = Field(..., description="Recent activity")
     last_active: Optional[datetime] = Field(None, description="Last activity timestamp")
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
-
 
 # Update forward references
 TokenResponse.model_rebuild()
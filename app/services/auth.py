@@ -1,13 +1,39 @@
-from typing import Dict, List, Optional
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 
 from firebase_admin import auth as firebase_auth
 from fastapi import HTTPException, status
 
+from app.core.config import settings
 from app.core.logging import get_logger, log_firebase_operation, log_security_event
 from app.services.firestore import get_firestore_service
 
 logger = get_logger(__name__)
 
+# Firebase Auth accepts at most 1000 UIDs per delete_users call
+MAX_DELETE_USERS_BATCH = 1000
+
+# Firestore commits at most 500 writes per batch
+MAX_FIRESTORE_BATCH_WRITES = 500
+
+T = TypeVar("T")
+
+# Firebase Auth admin calls block; give them their own threads so bulk work
+# cannot starve token verification and the log writer in the default executor
+_auth_executor = ThreadPoolExecutor(
+    max_workers=settings.AUTH_EXECUTOR_WORKERS, thread_name_prefix="firebase-auth"
+)
+
+
+async def run_auth_call(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking Firebase Auth SDK call on the auth executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _auth_executor, functools.partial(func, *args, **kwargs)
+    )
+
 
 class AuthService:
     """Service for Firebase Authentication operations."""
@@ -46,11 +72,15 @@ class AuthService:
                 auth_data["photo_url"] = photo_url
 
             # Create user in Firebase Auth
-            firebase_user = firebase_auth.create_user(**auth_data)
+            firebase_user = await run_auth_call(firebase_auth.create_user, **auth_data)
 
             # Set custom claims if provided
             if custom_claims:
-                firebase_auth.set_custom_user_claims(firebase_user.uid, custom_claims)
+                await run_auth_call(
+                    firebase_auth.set_custom_user_claims,
+                    firebase_user.uid,
+                    custom_claims,
+                )
 
             # Create user profile in Firestore
             user_profile = {
@@ -98,7 +128,7 @@ class AuthService:
         """Get user by UID from Firebase Auth and Firestore."""
         try:
             # Get user from Firebase Auth
-            firebase_user = firebase_auth.get_user(uid)
+            firebase_user = await run_auth_call(firebase_auth.get_user, uid)
 
             # Get user profile from Firestore
             user_profile = await self.firestore.get_document(self.users_collection, uid)
@@ -151,7 +181,7 @@ class AuthService:
     async def get_user_by_email(self, email: str) -> Optional[Dict]:
         """Get user by email from Firebase Auth."""
         try:
-            firebase_user = firebase_auth.get_user_by_email(email)
+            firebase_user = await run_auth_call(firebase_auth.get_user_by_email, email)
             return await self.get_user_by_uid(firebase_user.uid)
 
         except firebase_auth.UserNotFoundError:
@@ -201,11 +231,13 @@ class AuthService:
 
             # Update user in Firebase Auth
             if auth_update_data:
-                firebase_auth.update_user(uid, **auth_update_data)
+                await run_auth_call(firebase_auth.update_user, uid, **auth_update_data)
 
             # Update custom claims if provided
             if custom_claims is not None:
-                firebase_auth.set_custom_user_claims(uid, custom_claims)
+                await run_auth_call(
+                    firebase_auth.set_custom_user_claims, uid, custom_claims
+                )
 
             # Update user profile in Firestore
             firestore_update_data = {}
@@ -262,7 +294,7 @@ class AuthService:
         """Delete user from Firebase Auth and Firestore."""
         try:
             # Delete user from Firebase Auth
-            firebase_auth.delete_user(uid)
+            await run_auth_call(firebase_auth.delete_user, uid)
 
             # Delete user profile from Firestore
             await self.firestore.delete_document(self.users_collection, uid)
@@ -280,10 +312,76 @@ class AuthService:
                 detail=f"Failed to delete user: {str(e)}",
             )
 
+    async def delete_users(
+        self, uids: List[str], on_deleted: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, str]:
+        """Delete users from Firebase Auth and Firestore in batches.
+
+        on_deleted is called for each UID as soon as its auth account is gone,
+        before the profile cleanup. Returns the UIDs that could not be fully
+        deleted, mapped to the reason.
+        """
+        failed: Dict[str, str] = {}
+
+        for start in range(0, len(uids), MAX_DELETE_USERS_BATCH):
+            chunk = uids[start : start + MAX_DELETE_USERS_BATCH]
+            try:
+                result = await run_auth_call(firebase_auth.delete_users, chunk)
+            except Exception as e:
+                logger.error(
+                    "Failed to delete users", count=len(chunk), error=str(e), exc_info=e
+                )
+                failed.update((uid, str(e)) for uid in chunk)
+                continue
+
+            chunk_failed = {chunk[error.index]: error.reason for error in result.errors}
+            failed.update(chunk_failed)
+            if on_deleted is not None:
+                for uid in chunk:
+                    if uid not in chunk_failed:
+                        on_deleted(uid)
+
+        deleted = [uid for uid in uids if uid not in failed]
+
+        # Only drop profiles whose auth account is gone
+        for start in range(0, len(deleted), MAX_FIRESTORE_BATCH_WRITES):
+            chunk = deleted[start : start + MAX_FIRESTORE_BATCH_WRITES]
+            try:
+                await self.firestore.batch_write(
+                    [
+                        {
+                            "type": "delete",
+                            "collection": self.users_collection,
+                            "document_id": uid,
+                        }
+                        for uid in chunk
+                    ]
+                )
+            except Exception as e:
+                logger.error(
+                    "Failed to delete user profiles",
+                    count=len(chunk),
+                    error=str(e),
+                    exc_info=e,
+                )
+                failed.update(
+                    (uid, f"Account deleted but profile cleanup failed: {e}")
+                    for uid in chunk
+                )
+
+        log_firebase_operation(
+            "delete_users", deleted_count=len(deleted), failed_count=len(failed)
+        )
+
+        for uid in deleted:
+            log_security_event("user_deleted", user_id=uid)
+
+        return failed
+
     async def verify_id_token(self, token: str) -> Dict:
         """Verify Firebase ID token."""
         try:
-            decoded_token = firebase_auth.verify_id_token(token)
+            decoded_token = await asyncio.to_thread(firebase_auth.verify_id_token, token)
 
             log_firebase_operation(
                 "verify_id_token", uid=decoded_token["uid"], success=True
@@ -307,7 +405,9 @@ class AuthService:
     ) -> str:
         """Create Firebase custom token."""
         try:
-            custom_token = firebase_auth.create_custom_token(uid, additional_claims)
+            custom_token = await run_auth_call(
+                firebase_auth.create_custom_token, uid, additional_claims
+            )
 
             log_firebase_operation(
                 "create_custom_token",
@@ -331,7 +431,9 @@ class AuthService:
     ) -> Dict:
         """List users from Firebase Auth."""
         try:
-            page = firebase_auth.list_users(page_token, max_results)
+            page = await run_auth_call(
+                firebase_auth.list_users, page_token, max_results
+            )
 
             users = []
             for user in page.users:
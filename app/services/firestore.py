@@ -1,9 +1,12 @@
+import asyncio
+import itertools
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
-from firebase_admin import firestore
+from firebase_admin import firestore, firestore_async
 from google.cloud.firestore_v1 import FieldFilter, Query
 
+from app.core.config import settings
 from app.core.logging import get_logger, log_firebase_operation
 from app.services.firebase import get_firebase_app
 
@@ -14,14 +17,31 @@ class FirestoreService:
     """Service for Firestore operations."""
 
     def __init__(self):
-        self._client: Optional[firestore.Client] = None
+        self._client_cycle: Optional[Iterator[firestore.AsyncClient]] = None
+
+    def initialize(self) -> None:
+        """Create the pool of Firestore clients."""
+        if self._client_cycle is not None:
+            return
+
+        app = get_firebase_app()
+        # The first client is the app's shared one; the rest reuse its credential
+        clients = [firestore_async.client(app=app)]
+        credentials = app.credential.get_credential()
+        for _ in range(settings.FIRESTORE_CLIENT_POOL_SIZE - 1):
+            clients.append(
+                firestore.AsyncClient(credentials=credentials, project=app.project_id)
+            )
+
+        self._client_cycle = itertools.cycle(clients)
+        logger.info("Firestore client pool created", size=len(clients))
 
     @property
-    def client(self) -> firestore.Client:
-        """Get Firestore client."""
-        if self._client is None:
-            self._client = firestore.client(app=get_firebase_app())
-        return self._client
+    def client(self) -> firestore.AsyncClient:
+        """Get the next Firestore client from the pool."""
+        if self._client_cycle is None:
+            self.initialize()
+        return next(self._client_cycle)
 
     async def create_document(
         self,
@@ -46,10 +66,10 @@ class FirestoreService:
 
             if document_id:
                 doc_ref = self.client.collection(collection).document(document_id)
-                doc_ref.set(data, merge=merge)
+                await doc_ref.set(data, merge=merge)
                 result_id = document_id
             else:
-                doc_ref = self.client.collection(collection).add(data)[1]
+                doc_ref = (await self.client.collection(collection).add(data))[1]
                 result_id = doc_ref.id
 
             log_firebase_operation(
@@ -77,7 +97,7 @@ class FirestoreService:
         """Get a document from Firestore."""
         try:
             doc_ref = self.client.collection(collection).document(document_id)
-            doc = doc_ref.get()
+            doc = await doc_ref.get()
 
             if doc.exists:
                 data = doc.to_dict()
@@ -119,15 +139,15 @@ class FirestoreService:
     ) -> bool:
         """Update a document in Firestore."""
         try:
-            # Add updated timestamp
-            data["updated_at"] = firestore.SERVER_TIMESTAMP
+            # Add updated timestamp unless the caller already chose one
+            data.setdefault("updated_at", firestore.SERVER_TIMESTAMP)
 
             doc_ref = self.client.collection(collection).document(document_id)
 
             if merge:
-                doc_ref.set(data, merge=True)
+                await doc_ref.set(data, merge=True)
             else:
-                doc_ref.update(data)
+                await doc_ref.update(data)
 
             log_firebase_operation(
                 "update_document",
@@ -152,7 +172,7 @@ class FirestoreService:
         """Delete a document from Firestore."""
         try:
             doc_ref = self.client.collection(collection).document(document_id)
-            doc_ref.delete()
+            await doc_ref.delete()
 
             log_firebase_operation(
                 "delete_document", collection=collection, document_id=document_id
@@ -178,8 +198,13 @@ class FirestoreService:
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         descending: bool = False,
+        start_after: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
-        """Query documents from Firestore."""
+        """Query documents from Firestore.
+
+        ``start_after`` maps the ``order_by`` field and ``__name__`` (document
+        ID) to the values of the last document of the previous page.
+        """
         try:
             query = self.client.collection(collection)
 
@@ -189,13 +214,18 @@ class FirestoreService:
                     field = filter_item["field"]
                     operator = filter_item["operator"]
                     value = filter_item["value"]
-                    query = query.where(field, operator, value)
+                    query = query.where(filter=FieldFilter(field, operator, value))
 
             # Apply ordering
             if order_by:
                 direction = Query.DESCENDING if descending else Query.ASCENDING
                 query = query.order_by(order_by, direction=direction)
 
+                # Keyset pagination; document ID breaks ties on the order field
+                if start_after:
+                    query = query.order_by("__name__", direction=direction)
+                    query = query.start_after(start_after)
+
             # Apply limit and offset
             if offset:
                 query = query.offset(offset)
@@ -203,10 +233,8 @@ class FirestoreService:
                 query = query.limit(limit)
 
             # Execute query
-            docs = query.stream()
-
             results = []
-            for doc in docs:
+            async for doc in query.stream():
                 data = doc.to_dict()
                 data["id"] = doc.id
                 results.append(data)
@@ -232,10 +260,54 @@ class FirestoreService:
             )
             raise
 
+    async def project_documents(
+        self,
+        collection: str,
+        fields: List[str],
+        filters: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Read only the given fields of every matching document."""
+        try:
+            query = self.client.collection(collection)
+
+            # Apply filters
+            if filters:
+                for filter_item in filters:
+                    field = filter_item["field"]
+                    operator = filter_item["operator"]
+                    value = filter_item["value"]
+                    query = query.where(filter=FieldFilter(field, operator, value))
+
+            # A field mask keeps the payload to the requested fields
+            query = query.select(fields)
+            results = [doc.to_dict() async for doc in query.stream()]
+
+            log_firebase_operation(
+                "project_documents",
+                collection=collection,
+                fields=fields,
+                filters=filters,
+                count=len(results),
+            )
+
+            return results
+
+        except Exception as e:
+            logger.error(
+                "Failed to project documents",
+                collection=collection,
+                fields=fields,
+                filters=filters,
+                error=str(e),
+                exc_info=e,
+            )
+            raise
+
     async def batch_write(self, operations: List[Dict[str, Any]]) -> bool:
         """Perform batch write operations."""
         try:
-            batch = self.client.batch()
+            client = self.client
+            batch = client.batch()
 
             for operation in operations:
                 op_type = operation["type"]
@@ -249,25 +321,23 @@ class FirestoreService:
                     data["updated_at"] = firestore.SERVER_TIMESTAMP
 
                     if document_id:
-                        doc_ref = self.client.collection(collection).document(
-                            document_id
-                        )
+                        doc_ref = client.collection(collection).document(document_id)
                         batch.set(doc_ref, data)
                     else:
-                        doc_ref = self.client.collection(collection).document()
+                        doc_ref = client.collection(collection).document()
                         batch.set(doc_ref, data)
 
                 elif op_type == "update":
                     data["updated_at"] = firestore.SERVER_TIMESTAMP
-                    doc_ref = self.client.collection(collection).document(document_id)
+                    doc_ref = client.collection(collection).document(document_id)
                     batch.update(doc_ref, data)
 
                 elif op_type == "delete":
-                    doc_ref = self.client.collection(collection).document(document_id)
+                    doc_ref = client.collection(collection).document(document_id)
                     batch.delete(doc_ref)
 
             # Commit batch
-            batch.commit()
+            await batch.commit()
 
             log_firebase_operation("batch_write", operations_count=len(operations))
 
@@ -290,7 +360,10 @@ class FirestoreService:
             def transaction(transaction):
                 return transaction_func(transaction, *args, **kwargs)
 
-            result = transaction(self.client.transaction())
+            # Transactions take a sync function, so they run on the app's sync
+            # client in a worker thread rather than on the async pool
+            client = firestore.client(app=get_firebase_app())
+            result = await asyncio.to_thread(transaction, client.transaction())
 
             log_firebase_operation("run_transaction")
 
@@ -313,11 +386,10 @@ class FirestoreService:
                     field = filter_item["field"]
                     operator = filter_item["operator"]
                     value = filter_item["value"]
-                    query = query.where(field, operator, value)
+                    query = query.where(filter=FieldFilter(field, operator, value))
 
             # Get count
-            count_query = query.count()
-            result = count_query.get()
+            result = await query.count().get()
             count = result[0][0].value
 
             log_firebase_operation(
@@ -0,0 +1,41 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+
+class AsyncTTLBytesCache:
+    """A single cached bytes value, reloaded by one caller at a time once stale."""
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._value: Optional[bytes] = None
+        self._expires_at = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Get the refresh lock for the running event loop."""
+        # A lock is bound to the loop that first waits on it, so create one
+        # per loop instead of at import time
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def _is_fresh(self) -> bool:
+        return self._value is not None and self._expires_at > time.monotonic()
+
+    async def get(self, loader: Callable[[], Awaitable[bytes]]) -> bytes:
+        """Get the cached value, calling loader to refresh it when stale."""
+        if not self._is_fresh():
+            async with self._get_lock():
+                # Another request may have refreshed it while this one waited
+                if not self._is_fresh():
+                    self._value = await loader()
+                    self._expires_at = time.monotonic() + self.ttl
+        return self._value
+
+    def clear(self) -> None:
+        """Drop the cached value."""
+        self._value = None
@@ -1,11 +1,30 @@
+import asyncio
+import base64
+import json
 import re
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from urllib.parse import urlparse
 
 from pydantic import ValidationError
 
+# Strong references to fire-and-forget tasks so they are not garbage collected
+_background_tasks: Set[asyncio.Task] = set()
+
+# Firestore document IDs are limited to 1500 bytes
+MAX_DOCUMENT_ID_BYTES = 1500
+
 
 def generate_id() -> str:
     """Generate a unique ID."""
@@ -137,11 +156,32 @@ def format_duration(seconds: int) -> str:
         return f"{days}d {hours}h"
 
 
+def create_background_task(coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+    """Schedule a coroutine without awaiting it, keeping a reference until done."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
 def get_utc_now() -> datetime:
     """Get current UTC datetime."""
     return datetime.now(timezone.utc)
 
 
+def coerce_timestamps(data: Dict[str, Any], fields: Iterable[str]) -> None:
+    """Convert Firestore timestamps in data to naive local datetimes, in place."""
+    for field in fields:
+        value = data.get(field)
+        if value is None:
+            continue
+        # Naive datetimes would round-trip unchanged, so leave them be
+        if type(value) is datetime and value.tzinfo is None:
+            continue
+        if hasattr(value, "timestamp"):
+            data[field] = datetime.fromtimestamp(value.timestamp())
+
+
 def parse_datetime(dt_string: str) -> Optional[datetime]:
     """Parse datetime string with multiple format support."""
     formats = [
@@ -210,7 +250,7 @@ def validate_json_data(data: Any, schema_class) -> Dict[str, Any]:
     """Validate data against Pydantic schema."""
     try:
         validated = schema_class(**data)
-        return validated.dict()
+        return validated.model_dump()
     except ValidationError as e:
         raise ValueError(f"Validation error: {e}")
 
@@ -318,6 +358,42 @@ def generate_pagination_info(
     }
 
 
+def encode_cursor(created_at: datetime, doc_id: str) -> str:
+    """Encode a keyset pagination cursor for a document."""
+    payload = json.dumps({"created_at": created_at.isoformat(), "id": doc_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a keyset pagination cursor, raising ValueError if it is invalid."""
+    try:
+        payload = json.loads(
+            base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        )
+        created_at = datetime.fromisoformat(payload["created_at"])
+        doc_id = payload["id"]
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+    # Anything Firestore would refuse as a document ID
+    if not is_valid_document_id(doc_id):
+        raise ValueError("Invalid pagination cursor")
+
+    return created_at, doc_id
+
+
+def is_valid_document_id(doc_id: Any) -> bool:
+    """Check that a value can be used as a Firestore document ID."""
+    return (
+        isinstance(doc_id, str)
+        and bool(doc_id)
+        and "/" not in doc_id
+        and doc_id not in (".", "..")
+        and not (doc_id.startswith("__") and doc_id.endswith("__"))
+        and len(doc_id.encode()) <= MAX_DOCUMENT_ID_BYTES
+    )
+
+
 def extract_keywords(
     text: str, min_length: int = 3, max_keywords: int = 10
 ) -> List[str]:
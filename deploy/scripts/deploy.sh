@@ -245,7 +245,7 @@ deploy_service() {
     # Environment variables
     deploy_args+=(
         "--set-env-vars"
-        "ENVIRONMENT=$ENVIRONMENT,FIREBASE_PROJECT_ID=$PROJECT_ID,GOOGLE_CLOUD_PROJECT=$PROJECT_ID"
+        "ENVIRONMENT=$ENVIRONMENT,FIREBASE_PROJECT_ID=$PROJECT_ID,GOOGLE_CLOUD_PROJECT=$PROJECT_ID,TRUSTED_PROXY_HOPS=1"
     )
     
     # Secrets
@@ -1,6 +1,30 @@
+import base64
+import json
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest import mock
+
 import pytest
+from fastapi import HTTPException
 from httpx import AsyncClient
 
+from firebase_admin import auth as firebase_auth
+
+from app.core import security
+from app.core.config import settings
+from app.core.security import (
+    TOKEN_EXPIRY_LEEWAY_SECONDS,
+    create_access_token,
+    get_cached_id_token,
+    is_well_formed_id_token,
+    verify_firebase_token,
+    verify_id_token_cached,
+    verify_token,
+)
+from app.services import auth as auth_module
+from app.services.auth import AuthService
+
 
 class TestAuthentication:
     """Test authentication endpoints."""
@@ -134,3 +158,179 @@ class TestAuthentication:
         # This might fail if the user doesn't exist, which is expected in this test
         # The important thing is that the token format is validated
         assert response.status_code in [200, 401]
+
+
+class TestAccessTokens:
+    """Test locally issued JWT access tokens."""
+
+    def test_round_trip(self):
+        """Test that a token verifies to its subject and claims."""
+        token = create_access_token("user-123", additional_claims={"role": "admin"})
+
+        payload = verify_token(token)
+
+        assert payload["sub"] == "user-123"
+        assert payload["role"] == "admin"
+
+    def test_expired_token(self):
+        """Test that expired tokens are rejected."""
+        token = create_access_token("user-123", expires_delta=timedelta(seconds=-1))
+
+        with pytest.raises(HTTPException) as exc_info:
+            verify_token(token)
+
+        assert exc_info.value.status_code == 401
+
+    def test_tampered_token(self):
+        """Test that tokens with a bad signature are rejected."""
+        token = create_access_token("user-123")
+
+        with pytest.raises(HTTPException):
+            verify_token(token[:-2] + ("AA" if token[-2:] != "AA" else "BB"))
+
+
+class TestDeleteUsers:
+    """Test bulk user deletion."""
+
+    @staticmethod
+    def _delete_result(*errors):
+        return SimpleNamespace(
+            errors=[SimpleNamespace(index=i, reason=r) for i, r in errors]
+        )
+
+    async def test_deletes_in_chunks(self):
+        """Test that auth deletions and profile cleanup are chunked."""
+        service = AuthService()
+        service.firestore = mock.AsyncMock()
+        deleted = []
+
+        with (
+            mock.patch.object(auth_module, "MAX_DELETE_USERS_BATCH", 2),
+            mock.patch.object(auth_module, "MAX_FIRESTORE_BATCH_WRITES", 2),
+            mock.patch.object(
+                auth_module.firebase_auth,
+                "delete_users",
+                side_effect=[
+                    self._delete_result((1, "not found")),
+                    self._delete_result(),
+                ],
+            ) as delete_users,
+        ):
+            failed = await service.delete_users(
+                ["a", "b", "c", "d"], on_deleted=deleted.append
+            )
+
+        assert [call.args[0] for call in delete_users.call_args_list] == [
+            ["a", "b"],
+            ["c", "d"],
+        ]
+        assert failed == {"b": "not found"}
+        assert deleted == ["a", "c", "d"]
+        batches = [
+            [op["document_id"] for op in call.args[0]]
+            for call in service.firestore.batch_write.call_args_list
+        ]
+        assert batches == [["a", "c"], ["d"]]
+
+    async def test_profile_cleanup_failure(self):
+        """Test that a failed profile cleanup is reported per user."""
+        service = AuthService()
+        service.firestore = mock.AsyncMock()
+        service.firestore.batch_write.side_effect = RuntimeError("unavailable")
+
+        with mock.patch.object(
+            auth_module.firebase_auth,
+            "delete_users",
+            return_value=self._delete_result(),
+        ):
+            failed = await service.delete_users(["a", "b"])
+
+        assert set(failed) == {"a", "b"}
+        assert failed["a"].startswith("Account deleted but profile cleanup failed")
+
+
+def _id_token(header: dict) -> str:
+    """Build an unsigned token with the given header."""
+    encoded_header = base64.urlsafe_b64encode(json.dumps(header).encode()).decode()
+    return f"{encoded_header.rstrip('=')}.e30.signature"
+
+
+class TestIdTokenCache:
+    """Test caching of verified Firebase ID tokens."""
+
+    token = _id_token({"alg": "RS256", "kid": "key-1"})
+
+    def setup_method(self):
+        security._id_token_cache.clear()
+
+    def teardown_method(self):
+        security._id_token_cache.clear()
+
+    @staticmethod
+    def _decoded(expires_in: float) -> dict:
+        return {"uid": "user-123", "exp": time.time() + expires_in}
+
+    async def test_cache_hit_skips_verification(self):
+        """Test that a verified token is served from cache afterwards."""
+        decoded = self._decoded(3600)
+
+        with mock.patch.object(
+            security.firebase_auth, "verify_id_token", return_value=decoded
+        ) as verify:
+            assert await verify_id_token_cached(self.token) == decoded
+            assert await verify_id_token_cached(self.token) == decoded
+            assert await verify_firebase_token(self.token) == decoded
+
+        verify.assert_called_once()
+        assert get_cached_id_token(self.token) == decoded
+
+    async def test_entry_expires_before_token(self):
+        """Test that tokens within the expiry leeway are verified again."""
+        decoded = self._decoded(TOKEN_EXPIRY_LEEWAY_SECONDS - 1)
+
+        with mock.patch.object(
+            security.firebase_auth, "verify_id_token", return_value=decoded
+        ) as verify:
+            await verify_id_token_cached(self.token)
+            assert get_cached_id_token(self.token) is None
+            await verify_id_token_cached(self.token)
+
+        assert verify.call_count == 2
+
+    async def test_invalid_token_is_evicted(self):
+        """Test that a token failing verification is dropped from the cache."""
+        with mock.patch.object(
+            security.firebase_auth,
+            "verify_id_token",
+            return_value=self._decoded(TOKEN_EXPIRY_LEEWAY_SECONDS - 1),
+        ):
+            await verify_id_token_cached(self.token)
+
+        with mock.patch.object(
+            security.firebase_auth,
+            "verify_id_token",
+            side_effect=firebase_auth.RevokedIdTokenError("revoked"),
+        ):
+            with pytest.raises(firebase_auth.InvalidIdTokenError):
+                await verify_id_token_cached(self.token)
+
+        assert not security._id_token_cache
+
+    @pytest.mark.parametrize(
+        "token", ["", "not-a-token", "a.b", "!!.e30.sig", _id_token([])]
+    )
+    async def test_malformed_token_is_not_verified(self, token: str):
+        """Test that malformed tokens are rejected before verification."""
+        with mock.patch.object(security.firebase_auth, "verify_id_token") as verify:
+            with pytest.raises(HTTPException) as exc_info:
+                await verify_firebase_token(token)
+
+        assert exc_info.value.status_code == 401
+        verify.assert_not_called()
+
+    def test_production_tokens_need_rs256_and_kid(self):
+        """Test that outside the emulator only signed tokens look well formed."""
+        with mock.patch.dict(settings.__dict__, {"should_use_emulator": False}):
+            assert is_well_formed_id_token(self.token)
+            assert not is_well_formed_id_token(_id_token({"alg": "none"}))
+            assert not is_well_formed_id_token(_id_token({"alg": "RS256"}))
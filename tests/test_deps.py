@@ -0,0 +1,163 @@
+from unittest import mock
+
+import pytest
+from fastapi import HTTPException, Request
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.api import deps
+from app.api.v1 import users as users_module
+from app.core.config import settings
+from app.models.user import UserInDB
+from app.schemas.user import UserUpdateRequest
+
+
+def _user_doc(**overrides) -> dict:
+    """Build a stored user document."""
+    doc = {
+        "id": "user-123",
+        "uid": "user-123",
+        "email": "user@example.com",
+        "display_name": "Jane",
+        "email_verified": True,
+        "disabled": False,
+        "roles": ["user"],
+        "profile": {},
+        "preferences": {},
+        "provider": "email",
+    }
+    doc.update(overrides)
+    return doc
+
+
+class TestUserCache:
+    """Test caching of authenticated users."""
+
+    def setup_method(self):
+        deps._user_cache.clear()
+        deps._last_login_written.clear()
+
+    def teardown_method(self):
+        deps._user_cache.clear()
+        deps._last_login_written.clear()
+
+    async def test_cached_user_skips_lookup(self):
+        """Test that a loaded user is served from cache afterwards."""
+        with mock.patch.object(
+            deps._auth_service, "get_user_by_uid", return_value=_user_doc()
+        ) as get_user:
+            first = await deps._load_user("user-123")
+            second = await deps._load_user("user-123")
+
+        get_user.assert_awaited_once_with("user-123")
+        assert second is first
+
+    @pytest.mark.parametrize(
+        "user_doc, status_code", [(None, 404), (_user_doc(disabled=True), 403)]
+    )
+    async def test_unusable_user_is_not_cached(self, user_doc, status_code: int):
+        """Test that missing and disabled users are looked up every time."""
+        with mock.patch.object(
+            deps._auth_service, "get_user_by_uid", return_value=user_doc
+        ) as get_user:
+            for _ in range(2):
+                with pytest.raises(HTTPException) as exc_info:
+                    await deps._load_user("user-123")
+                assert exc_info.value.status_code == status_code
+
+        assert get_user.await_count == 2
+        assert "user-123" not in deps._user_cache
+
+    async def test_profile_update_reloads_user(self):
+        """Test that updating a profile drops the cached user."""
+        with mock.patch.object(
+            deps._auth_service, "get_user_by_uid", return_value=_user_doc()
+        ) as get_user:
+            user = await deps._load_user("user-123")
+
+            auth_service = mock.Mock()
+            auth_service.update_user = mock.AsyncMock(
+                return_value=_user_doc(display_name="Janet")
+            )
+            with mock.patch.object(
+                users_module, "get_auth_service", return_value=auth_service
+            ):
+                await users_module.update_my_profile(
+                    UserUpdateRequest(display_name="Janet"), current_user=user
+                )
+
+            assert "user-123" not in deps._user_cache
+            await deps._load_user("user-123")
+
+        assert get_user.await_count == 2
+
+    async def test_last_login_written_once_per_interval(self):
+        """Test that last_login_at is only scheduled once per interval."""
+        user = UserInDB.from_firestore_doc(_user_doc())
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="t")
+
+        with (
+            mock.patch.object(deps, "_authenticate", return_value=user),
+            mock.patch.object(
+                deps, "create_background_task", side_effect=lambda coro: coro.close()
+            ) as create_task,
+        ):
+            await deps.get_current_user(credentials)
+            await deps.get_current_user(credentials)
+            assert create_task.call_count == 1
+
+            # The interval has passed once the entry expires
+            deps._last_login_written.clear()
+            await deps.get_current_user(credentials)
+            assert create_task.call_count == 2
+
+    async def test_failed_last_login_write_is_retried(self):
+        """Test that a failed last_login_at write is retried next request."""
+        deps._last_login_written["user-123"] = True
+
+        with mock.patch.object(
+            deps._firestore_service,
+            "update_document",
+            side_effect=RuntimeError("unavailable"),
+        ):
+            await deps._update_last_login("user-123")
+
+        assert "user-123" not in deps._last_login_written
+
+
+def _request(forwarded_for=None) -> Request:
+    """Build a request from 10.0.0.1, optionally with X-Forwarded-For."""
+    headers = []
+    if forwarded_for is not None:
+        headers.append((b"x-forwarded-for", forwarded_for.encode()))
+    return Request({"type": "http", "headers": headers, "client": ("10.0.0.1", 12345)})
+
+
+class TestClientIp:
+    """Test resolving the client IP used for rate limiting."""
+
+    def test_header_ignored_without_trusted_proxies(self):
+        """Test that a client cannot choose its IP when no proxy is trusted."""
+        with mock.patch.object(settings, "TRUSTED_PROXY_HOPS", 0):
+            assert deps.get_client_ip(_request("203.0.113.7")) == "10.0.0.1"
+
+    def test_spoofed_entries_are_skipped(self):
+        """Test that only the entry appended by the trusted proxy is used."""
+        with mock.patch.object(settings, "TRUSTED_PROXY_HOPS", 1):
+            request = _request("198.51.100.9, 203.0.113.7")
+            assert deps.get_client_ip(request) == "203.0.113.7"
+
+    def test_multiple_hops(self):
+        """Test that the client entry is found behind several proxies."""
+        with mock.patch.object(settings, "TRUSTED_PROXY_HOPS", 2):
+            request = _request("198.51.100.9, 203.0.113.7, 10.0.0.2")
+            assert deps.get_client_ip(request) == "203.0.113.7"
+
+    @pytest.mark.parametrize("forwarded_for", [None, "203.0.113.7"])
+    def test_fewer_hops_than_trusted(self, forwarded_for):
+        """Test that the peer address is used when the header is short or absent."""
+        with mock.patch.object(settings, "TRUSTED_PROXY_HOPS", 2):
+            assert deps.get_client_ip(_request(forwarded_for)) == "10.0.0.1"
+
+    def test_default_trusts_no_proxies(self):
+        """Test that X-Forwarded-For is only honoured when configured."""
+        assert settings.model_fields["TRUSTED_PROXY_HOPS"].default == 0
@@ -0,0 +1,100 @@
+import base64
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from app.utils.cache import AsyncTTLBytesCache
+from app.utils.helpers import decode_cursor, encode_cursor, is_valid_document_id
+
+
+def _raw_cursor(payload) -> str:
+    """Encode a cursor payload without going through encode_cursor."""
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+class TestPaginationCursor:
+    """Test keyset pagination cursors."""
+
+    def test_round_trip(self):
+        """Test that a cursor decodes to what it was built from."""
+        created_at = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+
+        cursor = encode_cursor(created_at, "item-123")
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == (created_at, "item-123")
+
+    @pytest.mark.parametrize(
+        "cursor",
+        ["", "not-base64!", _raw_cursor([]), _raw_cursor({"id": "item-123"})],
+    )
+    def test_malformed_cursor(self, cursor: str):
+        """Test that malformed cursors are rejected."""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+    def test_invalid_created_at(self):
+        """Test that cursors with an unparsable timestamp are rejected."""
+        cursor = _raw_cursor({"created_at": "yesterday", "id": "item-123"})
+
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+    @pytest.mark.parametrize(
+        "doc_id", ["", "items/item-123", ".", "..", "__name__", "x" * 1501, 123]
+    )
+    def test_invalid_document_id(self, doc_id):
+        """Test that cursors Firestore could not seek to are rejected."""
+        cursor = _raw_cursor({"created_at": "2024-05-01T12:30:00", "id": doc_id})
+
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+class TestDocumentId:
+    """Test Firestore document ID validation."""
+
+    @pytest.mark.parametrize("doc_id", ["item-123", "a", "__x", "é" * 750])
+    def test_valid(self, doc_id: str):
+        """Test IDs Firestore accepts."""
+        assert is_valid_document_id(doc_id)
+
+    @pytest.mark.parametrize(
+        "doc_id", [None, "", "a/b", ".", "..", "__id__", "é" * 751]
+    )
+    def test_invalid(self, doc_id):
+        """Test IDs Firestore refuses."""
+        assert not is_valid_document_id(doc_id)
+
+
+class TestAsyncTTLBytesCache:
+    """Test the async TTL bytes cache."""
+
+    async def test_loads_once_while_fresh(self):
+        """Test that the loader only runs when the value is stale."""
+        cache = AsyncTTLBytesCache(ttl=60)
+        calls = []
+
+        async def loader() -> bytes:
+            calls.append(1)
+            return b"stats"
+
+        assert await cache.get(loader) == b"stats"
+        assert await cache.get(loader) == b"stats"
+        assert len(calls) == 1
+
+        cache.clear()
+        assert await cache.get(loader) == b"stats"
+        assert len(calls) == 2
+
+    async def test_expired_value_is_reloaded(self):
+        """Test that a value is reloaded once its TTL has passed."""
+        cache = AsyncTTLBytesCache(ttl=0)
+        values = iter([b"first", b"second"])
+
+        async def loader() -> bytes:
+            return next(values)
+
+        assert await cache.get(loader) == b"first"
+        assert await cache.get(loader) == b"second"
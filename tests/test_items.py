@@ -1,6 +1,20 @@
+from unittest import mock
+
 import pytest
+from fastapi import HTTPException
 from httpx import AsyncClient
 
+from app.api.v1 import items as items_module
+from app.api.v1.items import (
+    MAX_TAG_FILTERS,
+    _build_item_filters,
+    _cursor_start_after,
+    _parse_tags,
+    _tag_filter,
+    _unlike_item,
+)
+from app.models.item import ItemCategory
+
 
 class TestItems:
     """Test item endpoints."""
@@ -435,3 +449,84 @@ class TestItems:
             "/api/v1/items/stats/overview", headers=auth_headers
         )
         assert response.status_code == 403
+
+
+class TestItemFilters:
+    """Test building item list filters."""
+
+    def test_parse_tags(self):
+        """Test that tag filters are normalized and deduplicated in order."""
+        assert _parse_tags(" Python, api,python,, ") == ["python", "api"]
+
+    def test_too_many_tags(self):
+        """Test that filtering on too many tags is a bad request."""
+        tags = ",".join(f"tag{i}" for i in range(MAX_TAG_FILTERS + 1))
+
+        with pytest.raises(HTTPException) as exc_info:
+            _parse_tags(tags)
+
+        assert exc_info.value.status_code == 400
+
+    def test_tag_operator(self):
+        """Test that one tag uses array_contains and several array_contains_any."""
+        assert _tag_filter([]) is None
+        assert _tag_filter(["python"]) == {
+            "field": "tags",
+            "operator": "array_contains",
+            "value": "python",
+        }
+        assert _tag_filter(["python", "api"]) == {
+            "field": "tags",
+            "operator": "array_contains_any",
+            "value": ["python", "api"],
+        }
+
+    def test_anonymous_filters(self):
+        """Test that anonymous listings only see public items."""
+        filters = _build_item_filters(
+            None, category=ItemCategory.TECH, tag_list=["python"]
+        )
+
+        assert filters == [
+            {"field": "is_public", "operator": "==", "value": True},
+            {"field": "category", "operator": "==", "value": "tech"},
+            {"field": "tags", "operator": "array_contains", "value": "python"},
+        ]
+
+    def test_invalid_cursor(self):
+        """Test that an invalid cursor is a bad request."""
+        with pytest.raises(HTTPException) as exc_info:
+            _cursor_start_after("not-a-cursor")
+
+        assert exc_info.value.status_code == 400
+
+
+class TestUnlikeItem:
+    """Test taking back a like inside a transaction."""
+
+    def test_deletes_like_and_decrements(self):
+        """Test that the like is deleted and the count decremented together."""
+        transaction = mock.Mock()
+        like = mock.Mock()
+        transaction.get.return_value = iter([like])
+
+        with mock.patch.object(items_module.firestore, "client") as client:
+            assert _unlike_item(transaction, "item-123", "user-123")
+
+        transaction.delete.assert_called_once_with(like.reference)
+        item_ref, data = transaction.update.call_args.args
+        assert item_ref is client.return_value.collection.return_value.document(
+            "item-123"
+        )
+        assert data["like_count"].value == -1
+
+    def test_no_like_to_take_back(self):
+        """Test that nothing is written when the user has not liked the item."""
+        transaction = mock.Mock()
+        transaction.get.return_value = iter([])
+
+        with mock.patch.object(items_module.firestore, "client"):
+            assert not _unlike_item(transaction, "item-123", "user-123")
+
+        transaction.delete.assert_not_called()
+        transaction.update.assert_not_called()
@@ -0,0 +1,115 @@
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from app.models.item import MAX_ITEM_TAGS, ItemCreate, ItemUpdate
+from app.models.user import User, UserCreate
+from app.schemas.user import BulkUserActionRequest, UserResponse
+
+
+class TestItemValidation:
+    """Test item field validation."""
+
+    def test_title_is_trimmed(self):
+        """Test that titles are trimmed before the length check."""
+        item = ItemCreate(title="  My item  ")
+
+        assert item.title == "My item"
+
+    @pytest.mark.parametrize("title", ["", "   ", "x" * 201])
+    def test_invalid_title(self, title: str):
+        """Test that blank and overlong titles are rejected."""
+        with pytest.raises(ValidationError):
+            ItemCreate(title=title)
+
+    def test_blank_description_is_none(self):
+        """Test that a blank description is stored as missing."""
+        item = ItemCreate(title="My item", description="   ")
+
+        assert item.description is None
+
+    def test_description_too_long(self):
+        """Test that overlong descriptions are rejected."""
+        with pytest.raises(ValidationError):
+            ItemCreate(title="My item", description="x" * 2001)
+
+    def test_tags_are_normalized_and_deduplicated(self):
+        """Test that tags are trimmed, lowercased and deduplicated in order."""
+        item = ItemCreate(title="My item", tags=[" Python ", "api", "python", ""])
+
+        assert item.tags == ["python", "api"]
+
+    def test_extra_tags_are_dropped(self):
+        """Test that only the first MAX_ITEM_TAGS tags are kept."""
+        tags = [f"tag{i}" for i in range(MAX_ITEM_TAGS + 5)]
+
+        item = ItemCreate(title="My item", tags=tags)
+
+        assert item.tags == tags[:MAX_ITEM_TAGS]
+
+    def test_update_fields_are_optional(self):
+        """Test that an update validates only the fields it sets."""
+        update = ItemUpdate(title=" New title ")
+
+        assert update.title == "New title"
+        assert update.tags is None
+
+
+class TestUserValidation:
+    """Test user field validation."""
+
+    def test_display_name_is_trimmed(self):
+        """Test that display names are trimmed before the length check."""
+        user = UserCreate(email="user@example.com", display_name="  Jane  ")
+
+        assert user.display_name == "Jane"
+
+    @pytest.mark.parametrize("display_name", [" J ", "x" * 101])
+    def test_invalid_display_name(self, display_name: str):
+        """Test that too short and too long display names are rejected."""
+        with pytest.raises(ValidationError):
+            UserCreate(email="user@example.com", display_name=display_name)
+
+
+class TestUserResponse:
+    """Test building user responses."""
+
+    def test_from_user_matches_validation(self):
+        """Test that from_user gives the same response as validating the user."""
+        user = User(
+            uid="user-123",
+            email="user@example.com",
+            display_name="Jane",
+            email_verified=True,
+            roles=["user"],
+            created_at=datetime(2024, 5, 1, tzinfo=timezone.utc),
+        )
+
+        response = UserResponse.from_user(user)
+
+        assert response == UserResponse.model_validate(user)
+        assert response.model_dump_json() == (
+            UserResponse.model_validate(user).model_dump_json()
+        )
+
+
+class TestBulkUserActionRequest:
+    """Test bulk user action requests."""
+
+    @pytest.mark.parametrize("action", ["enable", "disable", "delete", "verify_email"])
+    def test_valid_action(self, action: str):
+        """Test that each supported action is accepted."""
+        request = BulkUserActionRequest(user_uids=["uid1"], action=action)
+
+        assert request.action == action
+
+    def test_unknown_action(self):
+        """Test that unsupported actions fail validation."""
+        with pytest.raises(ValidationError):
+            BulkUserActionRequest(user_uids=["uid1"], action="promote")
+
+    def test_empty_uids(self):
+        """Test that at least one UID is required."""
+        with pytest.raises(ValidationError):
+            BulkUserActionRequest(user_uids=[], action="disable")